@@ -1,85 +1,249 @@
+import hashlib
 import os
-import random as rd
-from flask import Flask, redirect, render_template, request, session, url_for
+import secrets
+import threading
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from flask import Flask, jsonify, redirect, render_template, request, session, url_for
+from markupsafe import Markup
 
 from cli_utils import handle_global_command
-from stats import load_stats, update_and_persist_stats
-
-GAMES = {
-    "Dice Roll": "dice",
-    "Coin Flip": "coin",
-    "Rock Paper Scissors": "rps",
-    "Meteor Dodge": "meteor",
-    "Planet Guess": "planet",
-    "Number Guess": "guess",
+from engine import COIN_SIDES, ENGINES, LOSS, METEOR_LANES, PENDING, RPS_CHOICES, TIE, WIN, GuessState, hint
+from metrics import install_metrics
+from rng import get_rng, session_rng
+from session_store import configure_sessions
+from stats import StatsCache
+
+
+class GameSpec(NamedTuple):
+    """Web-facing description of one game; the rules themselves live in `engine`."""
+
+    key: str
+    label: str
+    stat_label: str
+    icon: str
+    subtitle: str
+    playbook: tuple
+    rule: str
+    # Controls partial: tip line, prompt label and submit button. The engine's
+    # `choices` become a segmented picker (strings) or a slider (numbers).
+    tip: str
+    prompt: str
+    button: str
+    field: str
+    default: Any
+    parse: Callable[[Any], Any]
+    # Moves and draws from `codes` are stored in history as their index.
+    codes: tuple
+    # result -> (flash kind, title, detail); formatted with move, draw, hint and extras.
+    flashes: dict
+    # (loss, win) history lines; formatted with decoded first/second values.
+    details: tuple
+
+
+GAME_SPECS = {
+    spec.key: spec
+    for spec in (
+        GameSpec(
+            key="dice",
+            label="Dice Roll",
+            stat_label="Dice Roll",
+            icon="🎲",
+            subtitle="Pick a number and see if the die agrees with you.",
+            playbook=(
+                "Set your target number from 1 to 6.",
+                "Press Roll once to launch the round.",
+                "Match the roll to score a win.",
+            ),
+            rule="Dice Roll: win if your number matches the roll.",
+            tip="One tap, one roll. Clean and quick.",
+            prompt="Your prediction",
+            button="Roll the die",
+            field="prediction",
+            default=3,
+            parse=int,
+            codes=(),
+            flashes={
+                WIN: ("win", "Rolled {draw}", "Perfect call. You matched the die."),
+                LOSS: ("loss", "Rolled {draw}", "You predicted {move}. Queue up another round."),
+            },
+            details=("Predicted {first}, rolled {second}",) * 2,
+        ),
+        GameSpec(
+            key="coin",
+            label="Coin Flip",
+            stat_label="Coin Flip",
+            icon="🪙",
+            subtitle="Call heads or tails and ride your luck.",
+            playbook=(
+                "Choose Heads or Tails.",
+                "Flip once to resolve instantly.",
+                "Matching side scores a win.",
+            ),
+            rule="Coin Flip: win if the coin matches your call.",
+            tip="Short rounds with instant result tracking.",
+            prompt="Your call",
+            button="Flip coin",
+            field="choice",
+            default="Heads",
+            parse=str,
+            codes=COIN_SIDES,
+            flashes={
+                WIN: ("win", "Coin landed {draw}", "Clean read on the flip."),
+                LOSS: ("loss", "Coin landed {draw}", "You called {move}. Try a quick rematch."),
+            },
+            details=("Called {first}, got {second}",) * 2,
+        ),
+        GameSpec(
+            key="rps",
+            label="Rock Paper Scissors",
+            stat_label="RPS",
+            icon="✊",
+            subtitle="One clean round against the computer.",
+            playbook=(
+                "Choose Rock, Paper, or Scissors.",
+                "Play one round against computer choice.",
+                "Ties are neutral and not logged.",
+            ),
+            rule="Rock Paper Scissors: ties are neutral and not logged as wins/losses.",
+            tip="Ties are neutral and do not affect win/loss stats.",
+            prompt="Your choice",
+            button="Play",
+            field="user_choice",
+            default="Rock",
+            parse=str,
+            codes=RPS_CHOICES,
+            flashes={
+                WIN: ("win", "You won the round", "You: {move} | Computer: {draw}"),
+                LOSS: ("loss", "Computer won the round", "You: {move} | Computer: {draw}"),
+                TIE: ("neutral", "Tie round", "You: {move} | Computer: {draw}"),
+            },
+            details=("You: {first} | Computer: {second}",) * 2,
+        ),
+        GameSpec(
+            key="meteor",
+            label="Meteor Dodge",
+            stat_label="Meteor",
+            icon="☄️",
+            subtitle="Choose your lane and avoid impact.",
+            playbook=(
+                "Pick your lane: Left, Center, or Right.",
+                "Engage thrusters to reveal meteor lane.",
+                "Avoid the meteor lane to win.",
+            ),
+            rule="Meteor Dodge: win if your lane is different from the meteor lane.",
+            tip="If the meteor lands in your lane, it is a loss.",
+            prompt="Your lane",
+            button="Engage thrusters",
+            field="lane",
+            default="Center",
+            parse=str,
+            codes=METEOR_LANES,
+            flashes={
+                WIN: ("win", "Safe passage", "Meteor crossed {draw}. You chose {move}."),
+                LOSS: ("loss", "Direct hit", "Meteor crossed {draw}. You chose {move}."),
+            },
+            details=("Lane: {first} | Meteor: {second}",) * 2,
+        ),
+        GameSpec(
+            key="planet",
+            label="Planet Guess",
+            stat_label="Planet",
+            icon="🪐",
+            subtitle="Scan the right orbit to lock onto the target.",
+            playbook=(
+                "Scan an orbit from 1 to 8.",
+                "Ping to compare your orbit with target.",
+                "Exact orbit lock is a win.",
+            ),
+            rule="Planet Guess: win only on an exact orbit match.",
+            tip="Exact match wins. You get a higher/lower hint on misses.",
+            prompt="Your scan orbit",
+            button="Ping the planet",
+            field="guess",
+            default=4,
+            parse=int,
+            codes=(),
+            flashes={
+                WIN: ("win", "Target located", "Orbit {move} was the correct scan."),
+                LOSS: ("neutral", "Not orbit {move}", "Hint from scan: go {hint}."),
+            },
+            details=("Guessed {first}, target was {second}",) * 2,
+        ),
+        GameSpec(
+            key="guess",
+            label="Number Guess",
+            stat_label="Number Guess",
+            icon="🔢",
+            subtitle="Find the hidden number in three tries.",
+            playbook=(
+                "Pick a number from 1 to 10.",
+                "Use higher/lower hints across 3 tries.",
+                "Find the target before tries run out.",
+            ),
+            rule="Number Guess: win by finding the number in 3 tries.",
+            tip="Misses give you a higher/lower hint before the next try.",
+            prompt="Your guess",
+            button="Submit guess",
+            field="guess",
+            default=5,
+            parse=int,
+            codes=(),
+            flashes={
+                WIN: ("win", "Correct guess", "It was {draw}. Solved in {used} attempt{plural}."),
+                LOSS: ("loss", "Out of tries", "The number was {draw}. Fresh round loaded."),
+                PENDING: ("neutral", "Keep scanning", "Try {hint}. Tries left: {tries_left}."),
+            },
+            details=("Missed 3 tries, target was {second}", "Guessed {first} correctly in {second} attempt{plural}"),
+        ),
+    )
 }
 
-GAME_LABELS = {value: key for key, value in GAMES.items()}
-GAME_META = {
-    "Dice Roll": {"icon": "🎲", "subtitle": "Pick a number and see if the die agrees with you."},
-    "Coin Flip": {"icon": "🪙", "subtitle": "Call heads or tails and ride your luck."},
-    "Rock Paper Scissors": {"icon": "✊", "subtitle": "One clean round against the computer."},
-    "Meteor Dodge": {"icon": "☄️", "subtitle": "Choose your lane and avoid impact."},
-    "Planet Guess": {"icon": "🪐", "subtitle": "Scan the right orbit to lock onto the target."},
-    "Number Guess": {"icon": "🔢", "subtitle": "Find the hidden number in three tries."},
-}
-GAME_PLAYBOOK = {
-    "Dice Roll": (
-        "Set your target number from 1 to 6.",
-        "Press Roll once to launch the round.",
-        "Match the roll to score a win.",
-    ),
-    "Coin Flip": (
-        "Choose Heads or Tails.",
-        "Flip once to resolve instantly.",
-        "Matching side scores a win.",
-    ),
-    "Rock Paper Scissors": (
-        "Choose Rock, Paper, or Scissors.",
-        "Play one round against computer choice.",
-        "Ties are neutral and not logged.",
-    ),
-    "Meteor Dodge": (
-        "Pick your lane: Left, Center, or Right.",
-        "Engage thrusters to reveal meteor lane.",
-        "Avoid the meteor lane to win.",
-    ),
-    "Planet Guess": (
-        "Scan an orbit from 1 to 8.",
-        "Ping to compare your orbit with target.",
-        "Exact orbit lock is a win.",
-    ),
-    "Number Guess": (
-        "Pick a number from 1 to 10.",
-        "Use higher/lower hints across 3 tries.",
-        "Find the target before tries run out.",
-    ),
-}
+GAMES = {spec.label: spec.key for spec in GAME_SPECS.values()}
+GAME_LABELS = {spec.key: spec.label for spec in GAME_SPECS.values()}
+GAME_META = {spec.label: {"icon": spec.icon, "subtitle": spec.subtitle} for spec in GAME_SPECS.values()}
+GAME_PLAYBOOK = {spec.label: spec.playbook for spec in GAME_SPECS.values()}
+RULEBOOK = tuple(spec.rule for spec in GAME_SPECS.values())
+STAT_CARD_LABELS = {spec.key: spec.stat_label for spec in GAME_SPECS.values()}
 SESSION_DEFAULTS = {
-    "dice_attempts": 0,
-    "coin_attempts": 0,
-    "rps_attempts": 0,
-    "meteor_attempts": 0,
-    "planet_attempts": 0,
-    "guess_attempts": 0,
-    "dice_history": [],
-    "coin_history": [],
-    "rps_history": [],
-    "meteor_history": [],
-    "planet_history": [],
-    "guess_history": [],
+    **{f"{key}_attempts": 0 for key in GAME_SPECS},
+    **{f"{key}_history": [] for key in GAME_SPECS},
     "activity_feed": [],
+    "ring_heads": {},
     "guess_tries_left": 3,
 }
+HISTORY_CAPACITY = 25
+FEED_CAPACITY = 30
+HISTORY_KEYS = tuple(f"{key}_history" for key in GAME_SPECS) + ("activity_feed",)
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("FLASK_SECRET_KEY", "luck-arcade-dev-secret")
+configure_sessions(app)
+
+STATS = StatsCache(
+    flush_interval=float(os.environ.get("LUCK_ARCADE_STATS_FLUSH_SECONDS", "2")),
+    max_pending=int(os.environ.get("LUCK_ARCADE_STATS_FLUSH_ROUNDS", "50")),
+)
+METRICS = install_metrics(app, lambda: STATS.pending)
 
 
 def _ensure_session_state() -> None:
+    if "ring_heads" not in session:
+        # Older sessions kept pre-formatted, newest-first strings; start those fresh.
+        for key in HISTORY_KEYS:
+            session.pop(key, None)
     for key, value in SESSION_DEFAULTS.items():
-        session.setdefault(key, value.copy() if isinstance(value, list) else value)
-    session.setdefault("guess_target", rd.randint(1, 10))
+        session.setdefault(key, value.copy() if isinstance(value, (list, dict)) else value)
+    if "guess_target" not in session:
+        session["guess_target"] = ENGINES["guess"].new_state(_rng()).target
+    if "page_id" not in session:
+        session["page_id"] = secrets.token_urlsafe(8)
+
+
+def _touch_session() -> None:
+    """Bump the session's page version after anything that can change the page."""
+    session["page_version"] = session.get("page_version", 0) + 1
 
 
 def _reset_session_state() -> None:
@@ -88,8 +252,37 @@ def _reset_session_state() -> None:
     _ensure_session_state()
 
 
-def _stats() -> dict:
-    return load_stats()
+def _rng():
+    """Per-round provider: a seeded session replays the same stream of rounds."""
+    seed = session.get("rng_seed")
+    if seed is None:
+        rng = get_rng()
+    else:
+        round_index = session.get("rng_round", 0)
+        session["rng_round"] = round_index + 1
+        rng = session_rng(seed, round_index)
+    return rng if METRICS is None else METRICS.timed_rng(rng)
+
+
+def _seed_command(value: str) -> None:
+    parts = value.split()
+    if len(parts) == 1:
+        seed = session.get("rng_seed")
+        detail = f"Session seed: {seed}" if seed is not None else "Rounds are unseeded. Try 'seed 42'."
+        _set_flash("neutral", "Seed", detail, "⌨️")
+        return
+    if len(parts) != 2:
+        _set_flash("loss", "Seed", "Use 'seed <value>' or 'seed off'.", "⌨️")
+        return
+    if parts[1].lower() == "off":
+        session.pop("rng_seed", None)
+        session.pop("rng_round", None)
+        _set_flash("neutral", "Seed cleared", "Rounds use the shared random source again.", "⌨️")
+        return
+    session["rng_seed"] = parts[1]
+    session["rng_round"] = 0
+    session["guess_target"], session["guess_tries_left"] = ENGINES["guess"].new_state(_rng())
+    _set_flash("neutral", "Seed set", f"Rounds in this session now replay seed '{parts[1]}'.", "⌨️")
 
 
 def _wins(stats: dict, game: str) -> int:
@@ -100,57 +293,194 @@ def _losses(stats: dict, game: str) -> int:
     return stats[f"stats_{game}_loss"]
 
 
-def _plays(stats: dict, game: str) -> int:
-    return _wins(stats, game) + _losses(stats, game)
+class GameSummary(NamedTuple):
+    wins: int
+    losses: int
+    rate_number: int
+    rate: str
+    stat_card: tuple
+    game_card: dict
+
+
+class Dashboard(NamedTuple):
+    """Everything the dashboard derives from the totals, stamped with the cache version."""
+
+    source: StatsCache
+    version: int
+    stats: dict
+    games: dict
+    total_wins: int
+    luck_index: str
+    best_game_summary: str
+    stat_cards: tuple
+    game_cards: tuple
+    digest: str
+
+
+_dashboard_cache: Dashboard | None = None
+_dashboard_lock = threading.Lock()
+
+
+def _game_summary(stats: dict, game: str, previous: GameSummary | None) -> GameSummary:
+    wins, losses = _wins(stats, game), _losses(stats, game)
+    if previous is not None and previous.wins == wins and previous.losses == losses:
+        return previous
+    plays = wins + losses
+    rate_number = 0 if plays == 0 else round((wins / plays) * 100)
+    rate = f"{rate_number}%"
+    label = GAME_LABELS[game]
+    return GameSummary(
+        wins,
+        losses,
+        rate_number,
+        rate,
+        (STAT_CARD_LABELS[game], f"{wins}W / {losses}L", f"{rate} WR"),
+        {"label": label, "icon": GAME_META[label]["icon"], "subtitle": GAME_META[label]["subtitle"], "rate": rate},
+    )
 
 
-def _win_rate_number(stats: dict, game: str) -> int:
-    plays = _plays(stats, game)
-    return 0 if plays == 0 else round((_wins(stats, game) / plays) * 100)
+def _build_dashboard(version: int, stats: dict, previous: Dashboard | None) -> Dashboard:
+    games = {
+        game: _game_summary(stats, game, previous.games[game] if previous else None)
+        for game in GAMES.values()
+    }
+    total = stats["stats_total"]
+    total_wins = sum(summary.wins for summary in games.values())
+    luck_index = f"{0 if total == 0 else round((total_wins / total) * 100)}%"
+    played = [
+        (GAME_LABELS[game], summary.rate_number, summary.wins + summary.losses)
+        for game, summary in games.items()
+        if summary.wins + summary.losses > 0
+    ]
+    if played:
+        label, rate, rounds = max(played, key=lambda item: (item[1], item[2]))
+        best_game_summary = f"Top sector: {label} ({rate}% over {rounds} rounds)"
+    else:
+        best_game_summary = "No leading sector yet"
+    stat_cards = (
+        ("Total rounds", total, "Across all games"),
+        ("Total wins", total_wins, "Across all games"),
+        ("Win rate", luck_index, "Across all games"),
+    ) + tuple(summary.stat_card for summary in games.values())
+    return Dashboard(
+        STATS,
+        version,
+        stats,
+        games,
+        total_wins,
+        luck_index,
+        best_game_summary,
+        stat_cards,
+        tuple(summary.game_card for summary in games.values()),
+        # Versions are per process, so ETags hash the totals themselves.
+        hashlib.blake2b(repr(sorted(stats.items())).encode(), digest_size=8).hexdigest(),
+    )
 
 
-def _win_rate(stats: dict, game: str) -> str:
-    return f"{_win_rate_number(stats, game)}%"
+def _dashboard() -> Dashboard:
+    """Return the derived dashboard, rebuilding only the games whose counters moved."""
+    global _dashboard_cache
+    cached = _dashboard_cache
+    version, stats = STATS.snapshot()
+    if cached is not None and cached.source is STATS and cached.version == version:
+        return cached
+    with _dashboard_lock:
+        cached = _dashboard_cache
+        if cached is None or cached.source is not STATS:
+            cached = None
+        elif cached.version == version:
+            return cached
+        dashboard = _build_dashboard(version, stats, cached)
+        if cached is None or version > cached.version:
+            _dashboard_cache = dashboard
+        return dashboard
+
+
+_fragment_cache: dict[tuple, Markup] = {}
+
+
+def _fragment(name: str, game: str | None = None, **extra) -> Markup:
+    """Render `partials/<name>.html` once per game, extra values and mount point."""
+    key = (request.script_root, name, game, tuple(sorted(extra.items())))
+    html = _fragment_cache.get(key)
+    if html is None:
+        context = {"rulebook": RULEBOOK, **extra}
+        if game is not None:
+            context.update(
+                active_game=game,
+                active_key=GAMES[game],
+                active_meta=GAME_META[game],
+                playbook=GAME_PLAYBOOK[game],
+                spec=GAME_SPECS[GAMES[game]],
+                choices=ENGINES[GAMES[game]].choices,
+                resettable=PLAYERS.get(GAMES[game], ROUND_PLAYER).reset is not None,
+            )
+        html = _fragment_cache[key] = Markup(render_template(f"partials/{name}.html", **context))
+    return html
+
+
+def _page_fragments(game: str, guess_tries_left: int) -> dict:
+    return {
+        "sidebar_controls": _fragment("sidebar_controls", game),
+        "playbook": _fragment("playbook", game),
+        # Only the Number Guess form shows live state, and it has three possible values.
+        "game_controls": _fragment(
+            "game_controls", game, guess_tries_left=guess_tries_left if GAMES[game] == "guess" else None
+        ),
+        "rulebook": _fragment("rulebook"),
+    }
 
 
-def _total_wins(stats: dict) -> int:
-    return sum(_wins(stats, game) for game in GAMES.values())
+def _ring_push(key: str, entry: tuple, capacity: int) -> None:
+    """Write `entry` into the fixed-capacity ring stored at `session[key]`."""
+    items = session.get(key, [])
+    heads = session["ring_heads"]
+    head = heads.get(key, 0)
+    if len(items) < capacity:
+        items.append(entry)
+    else:
+        items[head] = entry
+    heads[key] = (head + 1) % capacity
+    session[key] = items
+    session.modified = True
 
 
-def _luck_index_number(stats: dict) -> int:
-    total = stats["stats_total"]
-    return 0 if total == 0 else round((_total_wins(stats) / total) * 100)
+def _ring_recent(key: str, limit: int) -> list:
+    items = session.get(key, [])
+    size = len(items)
+    head = session.get("ring_heads", {}).get(key, size)
+    return [items[(head - 1 - offset) % size] for offset in range(min(limit, size))]
 
 
-def _luck_index(stats: dict) -> str:
-    return f"{_luck_index_number(stats)}%"
+def _code(choices: tuple, value):
+    return choices.index(value) if value in choices else value
 
 
-def _best_game_summary(stats: dict) -> str:
-    played = [
-        (label, _win_rate_number(stats, game), _plays(stats, game))
-        for label, game in GAMES.items()
-        if _plays(stats, game) > 0
-    ]
-    if not played:
-        return "No leading sector yet"
-    label, rate, rounds = max(played, key=lambda item: (item[1], item[2]))
-    return f"Top sector: {label} ({rate}% over {rounds} rounds)"
-
-
-def _record_result(game: str, outcome: str, detail: str) -> None:
-    persisted = update_and_persist_stats(game, outcome)
-    history_key = f"{game}_history"
-    history = list(session.get(history_key, []))
-    history.insert(0, detail)
-    session[history_key] = history[:25]
-    game_label = GAME_LABELS[game]
-    icon = GAME_META[game_label]["icon"]
-    result_tag = "WIN" if outcome == "win" else "LOSS"
-    feed = list(session.get("activity_feed", []))
-    feed.insert(0, f"{icon} {game_label}: {detail} [{result_tag}]")
-    session["activity_feed"] = feed[:30]
-    session["last_persisted_stats"] = persisted
+def _decode(choices: tuple, value):
+    return choices[value] if choices and isinstance(value, int) else value
+
+
+def _format_detail(game: str, entry) -> str:
+    won, first, second = entry
+    spec = GAME_SPECS[game]
+    return spec.details[won].format(
+        first=_decode(spec.codes, first),
+        second=_decode(spec.codes, second),
+        plural="s" if second != 1 else "",
+    )
+
+
+def _format_feed(entry) -> str:
+    game, won, first, second = entry
+    spec = GAME_SPECS[game]
+    return f"{spec.icon} {spec.label}: {_format_detail(game, (won, first, second))} [{'WIN' if won else 'LOSS'}]"
+
+
+def _record_result(game: str, outcome: str, first, second) -> None:
+    STATS.record(game, outcome)
+    won = 1 if outcome == "win" else 0
+    _ring_push(f"{game}_history", (won, first, second), HISTORY_CAPACITY)
+    _ring_push("activity_feed", (game, won, first, second), FEED_CAPACITY)
 
 
 def _set_flash(kind: str, title: str, detail: str, icon: str) -> None:
@@ -175,15 +505,18 @@ def _quick_command(text: str) -> None:
         _reset_session_state()
         _set_flash("neutral", "Session reset", "Saved totals are still available.", "⌨️")
         return
+    if value.lower().split()[0] == "seed":
+        _seed_command(value)
+        return
     action = handle_global_command(value, context="main_menu")
     if action == "help":
-        _set_flash("neutral", "Quick Command", "Try: help, stats, reset", "⌨️")
+        _set_flash("neutral", "Quick Command", "Try: help, stats, reset, seed 42", "⌨️")
     elif action == "stats":
-        stats = _stats()
+        view = _dashboard()
         _set_flash(
             "neutral",
             "Saved totals",
-            f"Total plays: {stats['stats_total']} | Wins: {_total_wins(stats)} | Luck index: {_luck_index(stats)}",
+            f"Total plays: {view.stats['stats_total']} | Wins: {view.total_wins} | Luck index: {view.luck_index}",
             "⌨️",
         )
     elif action in ("menu", "quit"):
@@ -192,110 +525,90 @@ def _quick_command(text: str) -> None:
         _set_flash("loss", "Quick Command", f"Unknown command: '{value}'. Try 'help'.", "⌨️")
 
 
-def _rps_winner(user: str, comp: str) -> str:
-    if user == comp:
-        return "tie"
-    wins = {"Rock": "Scissors", "Paper": "Rock", "Scissors": "Paper"}
-    return "win" if wins[user] == comp else "loss"
+def _flash_outcome(spec: GameSpec, result: str, move, draw, **extra) -> None:
+    kind, title, detail = spec.flashes[result]
+    values = {"move": move, "draw": draw, **extra}
+    if isinstance(move, int) and isinstance(draw, int):
+        values["hint"] = hint(move, draw)
+    _set_flash(kind, title.format(**values), detail.format(**values), spec.icon)
+
+
+def _parse_move(spec: GameSpec, form) -> Any:
+    """Read the move from a form or JSON body; ValueError unless it is a legal choice."""
+    try:
+        move = spec.parse(form.get(spec.field, spec.default))
+    except (TypeError, ValueError):
+        move = None
+    if move is None or move not in ENGINES[spec.key].choices:
+        raise ValueError(f"Invalid move for {spec.label}.")
+    return move
+
+
+def _play_round(spec: GameSpec, move, rng) -> str:
+    outcome = ENGINES[spec.key].step(None, move, rng)
+    if outcome.result != TIE:
+        _record_result(spec.key, outcome.result, _code(spec.codes, move), _code(spec.codes, outcome.draw))
+    _flash_outcome(spec, outcome.result, move, outcome.draw)
+    return outcome.result
+
+
+def _play_guess(spec: GameSpec, move: int, rng) -> str:
+    engine = ENGINES[spec.key]
+    state = GuessState(session["guess_target"], session["guess_tries_left"])
+    outcome = engine.step(state, move, rng)
+    session["guess_target"], session["guess_tries_left"] = outcome.state
+    used = engine.attempts_used(state)
+    if outcome.result == WIN:
+        _record_result(spec.key, WIN, move, used)
+    elif outcome.result == LOSS:
+        _record_result(spec.key, LOSS, move, state.target)
+    _flash_outcome(
+        spec,
+        outcome.result,
+        move,
+        state.target,
+        used=used,
+        plural="s" if used != 1 else "",
+        tries_left=outcome.state.tries_left,
+    )
+    return outcome.result
 
 
-def _handle_game_action(game_label: str, form: dict) -> None:
-    game = GAMES[game_label]
+def _reset_guess(spec: GameSpec, rng) -> None:
+    session["guess_target"], session["guess_tries_left"] = ENGINES[spec.key].new_state(rng)
+    _set_flash("neutral", "Round reset", "Started a fresh number puzzle.", spec.icon)
 
-    if game == "dice":
-        prediction = int(form.get("prediction", 3))
-        session["dice_attempts"] = session.get("dice_attempts", 0) + 1
-        roll = rd.randint(1, 6)
-        outcome = "win" if roll == prediction else "loss"
-        _record_result("dice", outcome, f"Predicted {prediction}, rolled {roll}")
-        if outcome == "win":
-            _set_flash("win", f"Rolled {roll}", "Perfect call. You matched the die.", "🎲")
-        else:
-            _set_flash("loss", f"Rolled {roll}", f"You predicted {prediction}. Queue up another round.", "🎲")
-        return
 
-    if game == "coin":
-        choice = form.get("choice", "Heads")
-        session["coin_attempts"] = session.get("coin_attempts", 0) + 1
-        result = rd.choice(["Heads", "Tails"])
-        outcome = "win" if result == choice else "loss"
-        _record_result("coin", outcome, f"Called {choice}, got {result}")
-        if outcome == "win":
-            _set_flash("win", f"Coin landed {result}", "Clean read on the flip.", "🪙")
-        else:
-            _set_flash("loss", f"Coin landed {result}", f"You called {choice}. Try a quick rematch.", "🪙")
-        return
+class Player(NamedTuple):
+    """How the web app plays a game: one move, plus an optional mid-round reset."""
 
-    if game == "rps":
-        user_choice = form.get("user_choice", "Rock")
-        session["rps_attempts"] = session.get("rps_attempts", 0) + 1
-        comp_choice = rd.choice(["Rock", "Paper", "Scissors"])
-        result = _rps_winner(user_choice, comp_choice)
-        detail = f"You: {user_choice} | Computer: {comp_choice}"
-        if result == "tie":
-            _set_flash("neutral", "Tie round", detail, "✊")
-        else:
-            _record_result("rps", result, detail)
-            title = "You won the round" if result == "win" else "Computer won the round"
-            _set_flash(result, title, detail, "✊")
-        return
+    play: Callable[[GameSpec, Any, Any], str]
+    reset: Callable[[GameSpec, Any], None] | None = None
 
-    if game == "meteor":
-        lane = form.get("lane", "Center")
-        session["meteor_attempts"] = session.get("meteor_attempts", 0) + 1
-        incoming = rd.choice(["Left", "Center", "Right"])
-        outcome = "loss" if incoming == lane else "win"
-        detail = f"Lane: {lane} | Meteor: {incoming}"
-        _record_result("meteor", outcome, detail)
-        if outcome == "win":
-            _set_flash("win", "Safe passage", f"Meteor crossed {incoming}. You chose {lane}.", "☄️")
-        else:
-            _set_flash("loss", "Direct hit", f"Meteor crossed {incoming}. You chose {lane}.", "☄️")
-        return
 
-    if game == "planet":
-        guess = int(form.get("guess", 4))
-        session["planet_attempts"] = session.get("planet_attempts", 0) + 1
-        target = rd.randint(1, 8)
-        outcome = "win" if target == guess else "loss"
-        _record_result("planet", outcome, f"Guessed {guess}, target was {target}")
-        if outcome == "win":
-            _set_flash("win", "Target located", f"Orbit {guess} was the correct scan.", "🪐")
-        else:
-            hint = "higher" if target > guess else "lower"
-            _set_flash("neutral", f"Not orbit {guess}", f"Hint from scan: go {hint}.", "🪐")
-        return
+# Games that carry state between moves; everything else is a single `step`.
+ROUND_PLAYER = Player(_play_round)
+PLAYERS = {"guess": Player(_play_guess, reset=_reset_guess)}
 
-    if game == "guess":
-        if form.get("action") == "reset_round":
-            session["guess_target"] = rd.randint(1, 10)
-            session["guess_tries_left"] = 3
-            _set_flash("neutral", "Round reset", "Started a fresh number puzzle.", "🔢")
-            return
-
-        guess = int(form.get("guess", 5))
-        session["guess_attempts"] = session.get("guess_attempts", 0) + 1
-        target = session["guess_target"]
-        tries_left = session["guess_tries_left"]
-        if guess == target:
-            used = 4 - tries_left
-            suffix = "s" if used != 1 else ""
-            _record_result("guess", "win", f"Guessed {guess} correctly in {used} attempt{suffix}")
-            _set_flash("win", "Correct guess", f"It was {target}. Solved in {used} attempt{suffix}.", "🔢")
-            session["guess_target"] = rd.randint(1, 10)
-            session["guess_tries_left"] = 3
-            return
-
-        tries_left -= 1
-        session["guess_tries_left"] = tries_left
-        if tries_left <= 0:
-            _record_result("guess", "loss", f"Missed 3 tries, target was {target}")
-            _set_flash("loss", "Out of tries", f"The number was {target}. Fresh round loaded.", "🔢")
-            session["guess_target"] = rd.randint(1, 10)
-            session["guess_tries_left"] = 3
-        else:
-            hint = "higher" if target > guess else "lower"
-            _set_flash("neutral", "Keep scanning", f"Try {hint}. Tries left: {tries_left}.", "🔢")
+
+def _handle_game_action(game_label: str, form: dict) -> str | None:
+    """Play one move and return the engine result (None for a round reset).
+
+    The move is validated before the session is touched, so an invalid move
+    raises ValueError without counting an attempt or drawing a seeded round.
+    """
+    spec = GAME_SPECS[GAMES[game_label]]
+    player = PLAYERS.get(spec.key, ROUND_PLAYER)
+    if player.reset is not None and form.get("action") == "reset_round":
+        player.reset(spec, _rng())
+        return None
+    move = _parse_move(spec, form)
+    attempts_key = f"{spec.key}_attempts"
+    session[attempts_key] = session.get(attempts_key, 0) + 1
+    result = player.play(spec, move, _rng())
+    if METRICS is not None:
+        METRICS.plays.inc(spec.key, result)
+    return result
 
 
 @app.route("/", methods=["GET"])
@@ -304,63 +617,44 @@ def index():
     game = request.args.get("game", "Dice Roll")
     if game not in GAMES:
         game = "Dice Roll"
-    stats = _stats()
-    flash = _consume_flash()
+    view = _dashboard()
+    guess_tries_left = session.get("guess_tries_left", 3)
+    etag = None
+    if "flash_banner" not in session:
+        # A pending flash is shown once, so those pages are never revalidated.
+        etag = f"{view.digest}-{session['page_id']}-{session.get('page_version', 0)}-{GAMES[game]}"
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
     history_key = f"{GAMES[game]}_history"
-    game_cards = [
-        {
-            "label": label,
-            "icon": GAME_META[label]["icon"],
-            "subtitle": GAME_META[label]["subtitle"],
-            "rate": _win_rate(stats, key),
-            "active": label == game,
-        }
-        for label, key in GAMES.items()
-    ]
-    stat_cards = [
-        ("Total rounds", stats["stats_total"], "Across all games"),
-        ("Total wins", _total_wins(stats), "Across all games"),
-        ("Win rate", _luck_index(stats), "Across all games"),
-        ("Dice Roll", f"{_wins(stats, 'dice')}W / {_losses(stats, 'dice')}L", f"{_win_rate(stats, 'dice')} WR"),
-        ("Coin Flip", f"{_wins(stats, 'coin')}W / {_losses(stats, 'coin')}L", f"{_win_rate(stats, 'coin')} WR"),
-        ("RPS", f"{_wins(stats, 'rps')}W / {_losses(stats, 'rps')}L", f"{_win_rate(stats, 'rps')} WR"),
-        ("Meteor", f"{_wins(stats, 'meteor')}W / {_losses(stats, 'meteor')}L", f"{_win_rate(stats, 'meteor')} WR"),
-        ("Planet", f"{_wins(stats, 'planet')}W / {_losses(stats, 'planet')}L", f"{_win_rate(stats, 'planet')} WR"),
-        ("Number Guess", f"{_wins(stats, 'guess')}W / {_losses(stats, 'guess')}L", f"{_win_rate(stats, 'guess')} WR"),
-    ]
-    return render_template(
-        "index.html",
-        active_game=game,
-        active_key=GAMES[game],
-        active_meta=GAME_META[game],
-        game_cards=game_cards,
-        stats=stats,
-        total_wins=_total_wins(stats),
-        luck_index=_luck_index(stats),
-        best_game_summary=_best_game_summary(stats),
-        stat_cards=stat_cards,
-        playbook=GAME_PLAYBOOK[game],
-        flash=flash,
-        history=session.get(history_key, [])[:8],
-        activity_feed=session.get("activity_feed", [])[:8],
-        attempts={
-            "dice": session.get("dice_attempts", 0),
-            "coin": session.get("coin_attempts", 0),
-            "rps": session.get("rps_attempts", 0),
-            "meteor": session.get("meteor_attempts", 0),
-            "planet": session.get("planet_attempts", 0),
-            "guess": session.get("guess_attempts", 0),
-        },
-        guess_tries_left=session.get("guess_tries_left", 3),
-        rulebook=[
-            "Dice Roll: win if your number matches the roll.",
-            "Coin Flip: win if the coin matches your call.",
-            "Rock Paper Scissors: ties are neutral and not logged as wins/losses.",
-            "Meteor Dodge: win if your lane is different from the meteor lane.",
-            "Planet Guess: win only on an exact orbit match.",
-            "Number Guess: win by finding the number in 3 tries.",
-        ],
+    response = app.make_response(
+        render_template(
+            "index.html",
+            active_game=game,
+            active_key=GAMES[game],
+            active_meta=GAME_META[game],
+            fragments=_page_fragments(game, guess_tries_left),
+            game_cards=view.game_cards,
+            stats=view.stats,
+            total_wins=view.total_wins,
+            luck_index=view.luck_index,
+            best_game_summary=view.best_game_summary,
+            stat_cards=view.stat_cards,
+            flash=_consume_flash(),
+            history=[_format_detail(GAMES[game], entry) for entry in _ring_recent(history_key, 8)],
+            activity_feed=[_format_feed(entry) for entry in _ring_recent("activity_feed", 8)],
+            attempts={key: session.get(f"{key}_attempts", 0) for key in GAME_SPECS},
+            guess_tries_left=guess_tries_left,
+        )
     )
+    if etag is not None:
+        response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
 
 @app.route("/action", methods=["POST"])
@@ -377,11 +671,60 @@ def action():
     elif action_name == "quick_command":
         _quick_command(request.form.get("command", ""))
     else:
-        _handle_game_action(game, request.form)
+        try:
+            _handle_game_action(game, request.form)
+        except ValueError as error:
+            _set_flash("loss", "Invalid move", str(error), GAME_META[game]["icon"])
+    _touch_session()
 
     return redirect(url_for("index", game=game))
 
 
+@app.route("/api/play/<game>", methods=["POST"])
+def api_play(game: str):
+    if game not in GAME_LABELS:
+        return jsonify(error=f"Unknown game: {game}"), 404
+    payload = request.get_json(silent=True)
+    if payload is not None and not isinstance(payload, dict):
+        return jsonify(error="Expected a JSON object."), 400
+    _ensure_session_state()
+    try:
+        result = _handle_game_action(GAME_LABELS[game], request.form if payload is None else payload)
+    except ValueError as error:
+        return jsonify(error=str(error)), 400
+    _touch_session()
+    view = _dashboard()
+    summary = view.games[game]
+    recorded = result in (WIN, LOSS)
+    return jsonify(
+        game=game,
+        result=result,
+        flash=_consume_flash(),
+        deltas={"stats_total": 1, f"stats_{game}_{result}": 1} if recorded else {},
+        stats={
+            "stats_total": view.stats["stats_total"],
+            "wins": summary.wins,
+            "losses": summary.losses,
+            "win_rate": summary.rate,
+        },
+        attempts=session.get(f"{game}_attempts", 0),
+        guess_tries_left=session.get("guess_tries_left", 3),
+    )
+
+
+@app.route("/api/stats", methods=["GET"])
+def api_stats():
+    view = _dashboard()
+    return jsonify(
+        stats=view.stats,
+        total_wins=view.total_wins,
+        luck_index=view.luck_index,
+        best_game_summary=view.best_game_summary,
+        games={game: {"label": GAME_LABELS[game], "win_rate": summary.rate} for game, summary in view.games.items()},
+    )
+
+
 if __name__ == "__main__":
+    STATS.install_shutdown_hooks()
     port = int(os.environ.get("PORT", "8000"))
-    app.run(debug=True, port=port)
+    app.run(debug=os.environ.get("FLASK_DEBUG", "1") != "0", port=port)
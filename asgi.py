@@ -0,0 +1,159 @@
+"""ASGI entry point for the Flask arcade: `uvicorn asgi:application`.
+
+The event loop owns the sockets, so idle keep-alive players cost no threads.
+Each request is handed to the Flask app on a bounded thread pool
+(`LUCK_ARCADE_ASGI_THREADS`, default 32), so stats and session I/O never block
+the loop. Stats flushes run on a background thread instead of inside the
+request that fills the batch, and the lifespan shutdown event flushes whatever
+is still queued. Request bodies larger than `LUCK_ARCADE_ASGI_MAX_BODY` bytes
+(default 1 MiB) are refused with 413 before they are buffered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import STATS, app
+
+DEFAULT_THREADS = 32
+DEFAULT_MAX_BODY = 1 << 20
+
+
+class WsgiBridge:
+    """Run a WSGI app from ASGI, buffering each request and response body."""
+
+    def __init__(
+        self,
+        wsgi_app,
+        *,
+        threads: int = DEFAULT_THREADS,
+        max_body: int = DEFAULT_MAX_BODY,
+        on_shutdown=None,
+    ) -> None:
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="luck-arcade")
+        self.max_body = max_body
+        self.on_shutdown = on_shutdown
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+        else:
+            raise ValueError(f"Unsupported ASGI scope: {scope['type']}")
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self.on_shutdown is not None:
+                    await asyncio.get_running_loop().run_in_executor(self.executor, self.on_shutdown)
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send) -> None:
+        for name, value in scope.get("headers", []):
+            if name == b"content-length" and value.isdigit() and int(value) > self.max_body:
+                await self._too_large(send)
+                return
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if len(body) > self.max_body:
+                await self._too_large(send)
+                return
+            if not message.get("more_body", False):
+                break
+        environ = self._environ(scope, bytes(body))
+        loop = asyncio.get_running_loop()
+        status, headers, chunks = await loop.run_in_executor(self.executor, self._run, environ)
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b"".join(chunks)})
+
+    @staticmethod
+    async def _too_large(send) -> None:
+        body = b"Request body too large."
+        headers = [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": 413, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    def _run(self, environ: dict) -> tuple[int, list, list]:
+        response: dict = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers
+            ]
+            return lambda data: chunks.append(data)
+
+        chunks: list[bytes] = []
+        result = self.wsgi_app(environ, start_response)
+        try:
+            chunks.extend(result)
+        finally:
+            close = getattr(result, "close", None)
+            if close is not None:
+                close()
+        return response["status"], response["headers"], chunks
+
+    @staticmethod
+    def _environ(scope, body: bytes) -> dict:
+        root_path = scope.get("root_path", "")
+        path = scope["path"]
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client") or ("", 0)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+            "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server[0],
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0],
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for raw_name, raw_value in scope.get("headers", []):
+            name = raw_name.decode("latin-1").upper().replace("-", "_")
+            value = raw_value.decode("latin-1")
+            if name == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+                continue
+            if name == "CONTENT_LENGTH":
+                continue
+            key = f"HTTP_{name}"
+            if key in environ:
+                # HTTP/2 servers split cookies into several headers; they rejoin with "; ".
+                value = f"{environ[key]}{'; ' if key == 'HTTP_COOKIE' else ','}{value}"
+            environ[key] = value
+        return environ
+
+
+STATS.flush_inline = False
+application = WsgiBridge(
+    app,
+    threads=int(os.environ.get("LUCK_ARCADE_ASGI_THREADS", str(DEFAULT_THREADS))),
+    max_body=int(os.environ.get("LUCK_ARCADE_ASGI_MAX_BODY", str(DEFAULT_MAX_BODY))),
+    on_shutdown=STATS.flush,
+)
@@ -0,0 +1,145 @@
+"""Hot-path benchmarks: `python -m benchmarks --help`.
+
+A benchmark is a `setup(size, seed) -> state` / `run(state) -> ops` pair.
+Setup is never timed; each repeat gets a fresh state so runs that mutate files
+or documents stay independent. Results are JSON so a saved run can serve as the
+baseline for `--compare`.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+DEFAULT_SEED = 1234
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Callable[[int, int], Any]
+    run: Callable[[Any], int]
+    sizes: tuple[int, ...]
+    quick_sizes: tuple[int, ...]
+    unit: str = "op"
+    teardown: Callable[[Any], None] | None = None
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    size: int
+    repeat: int
+    ops: int
+    unit: str
+    min: float
+    median: float
+    mean: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+    @property
+    def per_op(self) -> float:
+        return self.median / self.ops if self.ops else 0.0
+
+    @property
+    def best_per_op(self) -> float:
+        return self.min / self.ops if self.ops else 0.0
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.ops / self.median if self.median > 0 else 0.0
+
+
+def measure(benchmark: Benchmark, size: int, *, repeat: int = 5, seed: int = DEFAULT_SEED) -> Result:
+    """Time `repeat` fresh runs of one benchmark at one size."""
+    timings = []
+    ops = 0
+    for index in range(repeat):
+        state = benchmark.setup(size, seed + index)
+        try:
+            started = time.perf_counter()
+            ops = benchmark.run(state)
+            timings.append(time.perf_counter() - started)
+        finally:
+            if benchmark.teardown is not None:
+                benchmark.teardown(state)
+    return Result(
+        benchmark.name,
+        size,
+        repeat,
+        ops,
+        benchmark.unit,
+        min(timings),
+        statistics.median(timings),
+        statistics.fmean(timings),
+    )
+
+
+def run_suite(
+    benchmarks: list[Benchmark],
+    *,
+    quick: bool = False,
+    repeat: int = 5,
+    seed: int = DEFAULT_SEED,
+    sizes: tuple[int, ...] | None = None,
+    report: Callable[[Result], None] | None = None,
+) -> list[Result]:
+    results = []
+    for benchmark in benchmarks:
+        for size in sizes or (benchmark.quick_sizes if quick else benchmark.sizes):
+            result = measure(benchmark, size, repeat=repeat, seed=seed)
+            results.append(result)
+            if report is not None:
+                report(result)
+    return results
+
+
+def to_json(results: list[Result], *, seed: int) -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": seed,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def load_results(path: str) -> list[Result]:
+    with open(path, encoding="utf-8") as handle:
+        return [Result(**entry) for entry in json.load(handle)["results"]]
+
+
+def compare(
+    results: list[Result], baseline: list[Result], *, threshold: float = DEFAULT_THRESHOLD
+) -> list[tuple[Result, Result, float, bool]]:
+    """Pair results with the baseline by name and size.
+
+    The ratio compares best-of-repeat per-op times, which are far less noisy
+    than medians; a ratio above `1 + threshold` is flagged as a regression.
+    """
+    previous = {result.key: result for result in baseline}
+    rows = []
+    for result in results:
+        before = previous.get(result.key)
+        if before is None or before.best_per_op == 0:
+            continue
+        ratio = result.best_per_op / before.best_per_op
+        rows.append((result, before, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def format_result(result: Result) -> str:
+    return (
+        f"{result.key:<32} {result.per_op * 1e6:>11.2f} us/{result.unit} "
+        f"{result.ops_per_second:>12,.0f} {result.unit}/s  (median of {result.repeat}, {result.ops} {result.unit}s)"
+    )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from benchmarks import (
+    DEFAULT_SEED,
+    DEFAULT_THRESHOLD,
+    compare,
+    format_result,
+    load_results,
+    run_suite,
+    to_json,
+)
+from benchmarks.cases import BENCHMARKS
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Time the arcade's hot paths.")
+    parser.add_argument("names", nargs="*", metavar="NAME", help="benchmark name prefixes (default: all)")
+    parser.add_argument("--quick", action="store_true", help="smallest sizes only")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--size", type=int, action="append", dest="sizes", help="override sizes (repeatable)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a saved --json run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be >= 1")
+
+    selected = [
+        benchmark
+        for benchmark in BENCHMARKS
+        if not args.names or any(benchmark.name.startswith(name) for name in args.names)
+    ]
+    if args.list:
+        for benchmark in selected:
+            print(f"{benchmark.name}: sizes {benchmark.sizes}")
+        return 0
+    if not selected:
+        parser.error(f"no benchmarks match: {', '.join(args.names)}")
+
+    results = run_suite(
+        selected,
+        quick=args.quick,
+        repeat=args.repeat,
+        seed=args.seed,
+        sizes=tuple(args.sizes) if args.sizes else None,
+        report=lambda result: print(format_result(result), flush=True),
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(to_json(results, seed=args.seed), handle, indent=2)
+            handle.write("\n")
+
+    if not args.compare:
+        return 0
+    regressions = 0
+    print(f"\nCompared with {args.compare} (threshold +{args.threshold:.0%}):")
+    for result, before, ratio, regressed in compare(results, load_results(args.compare), threshold=args.threshold):
+        regressions += regressed
+        verdict = "REGRESSION" if regressed else "ok"
+        print(
+            f"{result.key:<32} {before.best_per_op * 1e6:>10.2f} -> {result.best_per_op * 1e6:>10.2f} us"
+            f"  x{ratio:.2f}  {verdict}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
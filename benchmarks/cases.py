@@ -0,0 +1,217 @@
+"""Benchmark cases for stats persistence, RNG providers, the Flask request path and docx editing."""
+
+from __future__ import annotations
+
+import random
+import shutil
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import stats
+from benchmarks import Benchmark
+
+STATS_UPDATES = 200
+WEB_REQUESTS = 50
+WORDS = ("lucky", "arcade", "dice", "meteor", "orbit", "planet", "coin", "round", "draft", "ticket")
+
+_GAME_FORMS = {
+    "dice": ("Dice Roll", "prediction", ("1", "2", "3", "4", "5", "6")),
+    "coin": ("Coin Flip", "choice", ("Heads", "Tails")),
+    "rps": ("Rock Paper Scissors", "user_choice", ("Rock", "Paper", "Scissors")),
+    "meteor": ("Meteor Dodge", "lane", ("Left", "Center", "Right")),
+    "planet": ("Planet Guess", "guess", ("1", "2", "3", "4", "5", "6", "7", "8")),
+    "guess": ("Number Guess", "guess", ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10")),
+}
+
+
+def _outcomes(count: int, seed: int) -> list[tuple[str, str]]:
+    draw = random.Random(seed)
+    return [(draw.choice(stats.GAMES), draw.choice(stats.RESULTS)) for _ in range(count)]
+
+
+def _remove_tmpdir(state) -> None:
+    shutil.rmtree(state.tmpdir, ignore_errors=True)
+
+
+# --- stats persistence -------------------------------------------------------
+
+
+def _stats_setup(filename: str):
+    def setup(size: int, seed: int):
+        tmpdir = tempfile.mkdtemp(prefix="luck-bench-")
+        path = str(Path(tmpdir) / filename)
+        # `size` rounds are already on disk (journal records for the JSON store).
+        if size:
+            stats.record_many(_outcomes(size, seed + 1), storage_path=path)
+            if not stats._is_sqlite_path(path):
+                for game, result in _outcomes(size, seed + 2):
+                    stats.update_and_persist_stats(game, result, storage_path=path)
+        return SimpleNamespace(tmpdir=tmpdir, path=path, outcomes=_outcomes(STATS_UPDATES, seed))
+
+    return setup
+
+
+def _stats_update(state) -> int:
+    update = stats.update_and_persist_stats
+    for game, result in state.outcomes:
+        update(game, result, storage_path=state.path)
+    return len(state.outcomes)
+
+
+def _cache_setup(size: int, seed: int):
+    state = _stats_setup("stats.json")(0, seed)
+    state.cache = stats.StatsCache(state.path, flush_interval=60, max_pending=50)
+    state.outcomes = _outcomes(size, seed)
+    return state
+
+
+def _cache_record(state) -> int:
+    record = state.cache.record
+    for game, result in state.outcomes:
+        record(game, result)
+    state.cache.flush()
+    return len(state.outcomes)
+
+
+# --- RNG providers ---------------------------------------------------------------
+
+_RNG_CALLS = {
+    "randint": lambda provider: provider.randint(1, 6),
+    "choice": lambda provider: provider.choice(("Rock", "Paper", "Scissors")),
+    "random": lambda provider: provider.random(),
+}
+
+
+def _rng_setup(kind: str):
+    def setup(size: int, seed: int):
+        from rng import create_rng
+
+        return SimpleNamespace(provider=create_rng(kind, None if kind == "secure" else seed), size=size)
+
+    return setup
+
+
+def _rng_run(call: str):
+    def run(state) -> int:
+        draw = _RNG_CALLS[call]
+        provider = state.provider
+        for _ in range(state.size):
+            draw(provider)
+        return state.size
+
+    return run
+
+
+# --- Flask request path --------------------------------------------------------
+
+
+def _web_setup(game: str | None):
+    def setup(size: int, seed: int):
+        import app as arcade
+        from rng import set_rng
+
+        tmpdir = tempfile.mkdtemp(prefix="luck-bench-")
+        previous_stats = arcade.STATS
+        arcade.STATS = stats.StatsCache(str(Path(tmpdir) / "stats.json"), flush_interval=60)
+        set_rng(random.Random(seed))
+        client = arcade.app.test_client()
+        draw = random.Random(seed)
+        # `size` earlier rounds fill the session history rings before timing.
+        for index in range(size):
+            label, field, choices = _GAME_FORMS[stats.GAMES[index % len(stats.GAMES)]]
+            client.post("/action", data={"game": label, field: draw.choice(choices)})
+        client.get("/")
+        forms = []
+        if game is not None:
+            label, field, choices = _GAME_FORMS[game]
+            forms = [{"game": label, field: draw.choice(choices)} for _ in range(WEB_REQUESTS)]
+        return SimpleNamespace(tmpdir=tmpdir, arcade=arcade, previous_stats=previous_stats, client=client, forms=forms)
+
+    return setup
+
+
+def _web_teardown(state) -> None:
+    from rng import set_rng
+
+    state.arcade.STATS = state.previous_stats
+    set_rng(None)
+    _remove_tmpdir(state)
+
+
+def _web_index(state) -> int:
+    get = state.client.get
+    for _ in range(WEB_REQUESTS):
+        get("/")
+    return WEB_REQUESTS
+
+
+def _web_action(state) -> int:
+    post = state.client.post
+    for form in state.forms:
+        post("/action", data=form)
+    return len(state.forms)
+
+
+# --- docx editing --------------------------------------------------------------
+
+
+def _docx_setup(size: int, seed: int):
+    from docx_editor import add_table, create_document
+
+    draw = random.Random(seed)
+    document = create_document()
+    for _ in range(size):
+        paragraph = document.add_paragraph()
+        for _ in range(4):
+            paragraph.add_run(" ".join(draw.choice(WORDS) for _ in range(6)) + " ")
+    add_table(document, data=[[draw.choice(WORDS) for _ in range(4)] for _ in range(max(1, size // 20))])
+    return SimpleNamespace(document=document)
+
+
+def _docx_delete_text(state) -> int:
+    from docx_editor import delete_text
+
+    delete_text(state.document, "lucky", whole_word=True)
+    return 1
+
+
+def _table_setup(size: int, seed: int):
+    from docx_editor import create_document
+
+    draw = random.Random(seed)
+    return SimpleNamespace(
+        document=create_document(), data=[[draw.choice(WORDS) for _ in range(10)] for _ in range(size)]
+    )
+
+
+def _docx_add_table(state) -> int:
+    from docx_editor import add_table
+
+    add_table(state.document, data=state.data)
+    return len(state.data)
+
+
+BENCHMARKS = [
+    Benchmark(
+        "stats.update_and_persist", _stats_setup("stats.json"), _stats_update,
+        (0, 128, 255), (0,), "update", _remove_tmpdir,
+    ),
+    Benchmark(
+        "stats.update_and_persist_sqlite", _stats_setup("stats.db"), _stats_update,
+        (0, 10_000), (0,), "update", _remove_tmpdir,
+    ),
+    Benchmark("stats.cache_record", _cache_setup, _cache_record, (1_000, 10_000), (1_000,), "round", _remove_tmpdir),
+    *(
+        Benchmark(f"rng.{call}.{kind}", _rng_setup(kind), _rng_run(call), (10_000, 200_000), (10_000,), "draw")
+        for call in _RNG_CALLS
+        for kind in ("python", "buffered", "secure")
+    ),
+    Benchmark("web.index", _web_setup(None), _web_index, (0, 8, 25), (0,), "request", _web_teardown),
+    *(
+        Benchmark(f"web.action.{game}", _web_setup(game), _web_action, (0, 25), (0,), "request", _web_teardown)
+        for game in _GAME_FORMS
+    ),
+    Benchmark("docx.delete_text", _docx_setup, _docx_delete_text, (200, 2_000, 10_000), (200,), "call"),
+    Benchmark("docx.add_table", _table_setup, _docx_add_table, (100, 1_000, 5_000), (100,), "row"),
+]
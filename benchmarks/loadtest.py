@@ -0,0 +1,288 @@
+"""Drive the arcade with many simulated players: `python -m benchmarks.loadtest`.
+
+Each player is a thread with its own session that plays rounds through
+`POST /api/play/<game>`, either in-process via `app.test_client()` or against a
+running server (`--url`). The report covers throughput, latency percentiles,
+errors (HTTP failures and exceptions such as stats-file contention), and
+whether `stats_total` grew by exactly the number of recorded wins and losses.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.cookiejar
+import json
+import random
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+GAME_MOVES = {
+    "dice": ("prediction", (1, 2, 3, 4, 5, 6)),
+    "coin": ("choice", ("Heads", "Tails")),
+    "rps": ("user_choice", ("Rock", "Paper", "Scissors")),
+    "meteor": ("lane", ("Left", "Center", "Right")),
+    "planet": ("guess", (1, 2, 3, 4, 5, 6, 7, 8)),
+    "guess": ("guess", (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)),
+}
+
+
+class InProcessTransport:
+    def __init__(self, app) -> None:
+        self.client = app.test_client()
+
+    def request(self, method: str, path: str, payload: dict | None = None) -> tuple[int, dict | None]:
+        response = self.client.open(path, method=method, json=payload)
+        return response.status_code, response.get_json(silent=True)
+
+
+class HttpTransport:
+    def __init__(self, base_url: str, timeout: float = 30.0) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def request(self, method: str, path: str, payload: dict | None = None) -> tuple[int, dict | None]:
+        data = None if payload is None else json.dumps(payload).encode()
+        headers = {} if payload is None else {"Content-Type": "application/json"}
+        request = urllib.request.Request(self.base_url + path, data=data, headers=headers, method=method)
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                return response.status, json.loads(response.read() or b"null")
+        except urllib.error.HTTPError as error:
+            return error.code, None
+
+
+@dataclass
+class PlayerStats:
+    latencies: list[float] = field(default_factory=list)
+    recorded: int = 0
+    results: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class LoadReport:
+    players: int
+    elapsed: float
+    latencies: list[float]
+    recorded: int
+    results: Counter
+    errors: Counter
+    stats_before: int
+    stats_after: int
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        return 0.0 if self.elapsed <= 0 else len(self.latencies) / self.elapsed
+
+    @property
+    def consistent(self) -> bool:
+        return self.stats_after - self.stats_before == self.recorded
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """`dice=3,coin=1` -> weights; games left out are not played. Empty means all equal."""
+    if not text:
+        return {game: 1.0 for game in GAME_MOVES}
+    mix = {}
+    for part in text.split(","):
+        game, _, weight = part.partition("=")
+        game = game.strip()
+        if game not in GAME_MOVES:
+            raise ValueError(f"Unsupported game in mix: {game}")
+        mix[game] = float(weight or 1)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("The mix needs at least one positive weight.")
+    return mix
+
+
+def _play(transport, mix: dict[str, float], think: float, rounds: int, deadline: float, seed: int, start, stats):
+    draw = random.Random(seed)
+    games = list(mix)
+    weights = [mix[game] for game in games]
+    start.wait()
+    played = 0
+    while played < rounds and time.monotonic() < deadline:
+        game = draw.choices(games, weights)[0]
+        field_name, moves = GAME_MOVES[game]
+        started = time.perf_counter()
+        try:
+            status, payload = transport.request("POST", f"/api/play/{game}", {field_name: draw.choice(moves)})
+        except Exception as error:  # noqa: BLE001 - every failure is part of the report
+            stats.errors[type(error).__name__] += 1
+        else:
+            if status == 200 and payload is not None:
+                stats.latencies.append(time.perf_counter() - started)
+                stats.results[(game, payload["result"])] += 1
+                stats.recorded += payload["result"] in ("win", "loss")
+            else:
+                stats.errors[f"HTTP {status}"] += 1
+        played += 1
+        if think > 0:
+            time.sleep(draw.expovariate(1 / think))
+
+
+def run_load(
+    make_transport,
+    read_total,
+    *,
+    players: int = 20,
+    rounds: int = 100,
+    duration: float = 0.0,
+    think: float = 0.0,
+    mix: dict[str, float] | None = None,
+    seed: int = 1234,
+) -> LoadReport:
+    """Run `players` threads until each has played `rounds` (or `duration` seconds pass)."""
+    mix = mix or parse_mix("")
+    stats_before = read_total()
+    per_player = [PlayerStats() for _ in range(players)]
+    transports = [make_transport() for _ in range(players)]
+    start = threading.Event()
+    deadline = time.monotonic() + duration if duration > 0 else float("inf")
+    rounds = rounds if rounds > 0 else 1 << 62
+    threads = [
+        threading.Thread(
+            target=_play,
+            args=(transports[index], mix, think, rounds, deadline, seed + index, start, per_player[index]),
+            daemon=True,
+        )
+        for index in range(players)
+    ]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    start.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    results: Counter = Counter()
+    errors: Counter = Counter()
+    for stats in per_player:
+        results.update(stats.results)
+        errors.update(stats.errors)
+    return LoadReport(
+        players,
+        elapsed,
+        [latency for stats in per_player for latency in stats.latencies],
+        sum(stats.recorded for stats in per_player),
+        results,
+        errors,
+        stats_before,
+        read_total(),
+    )
+
+
+def format_report(report: LoadReport) -> str:
+    lines = [
+        f"players: {report.players} | requests: {report.requests:,} in {report.elapsed:.2f}s "
+        f"| {report.throughput:,.0f} req/s",
+        "latency: "
+        + " ".join(
+            f"p{int(q * 100)}={report.percentile(q) * 1000:.2f}ms" for q in (0.5, 0.9, 0.99)
+        )
+        + f" max={max(report.latencies, default=0) * 1000:.2f}ms",
+    ]
+    by_game: Counter = Counter()
+    for (game, _), count in report.results.items():
+        by_game[game] += count
+    lines.append("plays: " + ", ".join(f"{game}={count}" for game, count in sorted(by_game.items())))
+    lines.append(
+        "errors: " + (", ".join(f"{name}={count}" for name, count in report.errors.most_common()) or "none")
+    )
+    verdict = "consistent" if report.consistent else "MISMATCH"
+    lines.append(
+        f"stats_total: {report.stats_before} -> {report.stats_after} "
+        f"(+{report.stats_after - report.stats_before}, expected +{report.recorded}) {verdict}"
+    )
+    return "\n".join(lines)
+
+
+def _in_process(args):
+    import app as arcade
+    from stats import StatsCache, load_stats
+
+    tmpdir = tempfile.TemporaryDirectory(prefix="luck-load-")
+    path = args.stats_path or str(Path(tmpdir.name) / "stats.json")
+    arcade.STATS = StatsCache(path, flush_interval=args.flush_seconds, max_pending=args.flush_rounds)
+
+    def read_total() -> int:
+        arcade.STATS.flush()
+        return load_stats(path)["stats_total"]
+
+    return (lambda: InProcessTransport(arcade.app)), read_total, tmpdir
+
+
+def _remote(args):
+    def read_total() -> int:
+        # Workers flush on their own timers; give them time before reading.
+        time.sleep(args.settle)
+        status, payload = HttpTransport(args.url).request("GET", "/api/stats")
+        if status != 200 or payload is None:
+            raise SystemExit(f"GET /api/stats failed with HTTP {status}")
+        return payload["stats"]["stats_total"]
+
+    return (lambda: HttpTransport(args.url)), read_total, None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest", description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=100, help="rounds per player (0 = until --duration)")
+    parser.add_argument("--duration", type=float, default=0.0, help="stop after this many seconds")
+    parser.add_argument("--think", type=float, default=0.0, help="mean think time between rounds (seconds)")
+    parser.add_argument("--mix", default="", help="game weights, e.g. dice=3,coin=1 (default: all equal)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--url", help="drive a running server instead of the in-process app")
+    parser.add_argument("--settle", type=float, default=3.0, help="wait before reading remote totals (seconds)")
+    parser.add_argument("--stats-path", help="in-process stats file (default: a temporary one)")
+    parser.add_argument("--flush-seconds", type=float, default=2.0)
+    parser.add_argument("--flush-rounds", type=int, default=50)
+    args = parser.parse_args(argv)
+    if args.players < 1:
+        parser.error("--players must be >= 1")
+    if args.rounds <= 0 and args.duration <= 0:
+        parser.error("set --rounds or --duration")
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as error:
+        parser.error(str(error))
+
+    make_transport, read_total, tmpdir = _remote(args) if args.url else _in_process(args)
+    try:
+        report = run_load(
+            make_transport,
+            read_total,
+            players=args.players,
+            rounds=args.rounds,
+            duration=args.duration,
+            think=args.think,
+            mix=mix,
+            seed=args.seed,
+        )
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+    print(format_report(report))
+    return 0 if report.consistent and not report.errors else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,10 @@
-import random as rd
-
 from cli_utils import prompt_nonempty, prompt_yes_no, run_global_command
+from engine import ENGINES, WIN
+from rng import get_rng
 from stats import update_and_persist_stats
 
+_COIN = ENGINES["coin"]
+
 
 def _normalize_choice(text: str) -> str | None:
     if not text:
@@ -56,11 +58,11 @@ def continuous_game_coin_flip():
             continue
 
         attempts += 1
-        coin_result = rd.choice(["Heads", "Tails"])
+        outcome = _COIN.step(None, user_choice, get_rng())
         print()
-        print("Coin says:", coin_result)
+        print("Coin says:", outcome.draw)
 
-        if coin_result == user_choice:
+        if outcome.result == WIN:
             streak += 1
             update_and_persist_stats("coin", "win")
             print("Nice call, you got it.")
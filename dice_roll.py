@@ -1,18 +1,24 @@
-import random as rd
-
 from cli_utils import prompt_nonempty, run_global_command
+from engine import ENGINES, WIN
+from rng import get_rng
 from stats import update_and_persist_stats
 
+_DICE = ENGINES["dice"]
+
 greet = """
 Dice Roll game.
 Pick a number between 1 and 6.
     """
 
 
-def continuous_game_dice_roll():
-    """Keep rolling until your guessed number shows up."""
+def continuous_game_dice_roll(show_rolls: bool = False):
+    """Keep rolling until your guessed number shows up.
+
+    By default the number of rolls is sampled in one go and only a summary is
+    printed; type `rolls` to toggle the roll-by-roll transcript.
+    """
     print(greet)
-    print("Commands: help, stats, menu, quit")
+    print("Commands: help, stats, menu, quit, rolls")
     while True:
         user_prediction = prompt_nonempty(
             'Enter your prediction (1-6) or "quit" to exit: ',
@@ -26,7 +32,7 @@ def continuous_game_dice_roll():
         signal = run_global_command(
             user_prediction,
             context="game",
-            on_help=lambda: print("Type a number 1-6. Use menu to return."),
+            on_help=lambda: print("Type a number 1-6. Type rolls to show every roll. Use menu to return."),
             on_stats=lambda: print("Stats: shown after a completed round."),
         )
         if signal == "quit":
@@ -37,6 +43,10 @@ def continuous_game_dice_roll():
             return
         if signal == "handled":
             continue
+        if user_prediction.strip().lower() == "rolls":
+            show_rolls = not show_rolls
+            print(f"Roll-by-roll transcript {'on' if show_rolls else 'off'}.")
+            continue
         try:
             up = int(user_prediction)
         except ValueError:
@@ -46,21 +56,21 @@ def continuous_game_dice_roll():
             print("Use a number from 1 to 6.")
             continue
 
-        attempts = 0
-        while True:
-            attempts += 1
-            dice_roll = rd.randint(1, 6)
+        rng = get_rng()
+        attempts = _DICE.sample_attempts(rng)
+        if show_rolls:
+            for dice_roll in _DICE.iter_rolls(up, attempts, rng):
+                print()
+                print(f"You rolled a {dice_roll}.")
+                if dice_roll != up:
+                    print("Not yet. Rolling again...")
+        else:
             print()
-            print(f"You rolled a {dice_roll}.")
-            if dice_roll == up:
-                update_and_persist_stats("dice", "win")
-                print("Nice, you guessed it.")
-                print(f'It took {attempts} attempt{"s" if attempts != 1 else ""} to get it right.')
-                print("Good run.")
-                break
-            else:
-                print("Not yet. Rolling again...")
-
+            print(f"Rolled until a {up} showed up.")
+        update_and_persist_stats("dice", "win")
+        print("Nice, you guessed it.")
+        print(f'It took {attempts} attempt{"s" if attempts != 1 else ""} to get it right.')
+        print("Good run.")
         print()
         return
 
@@ -102,10 +112,10 @@ def game_dice_roll():
             print("Use a number from 1 to 6.")
             continue
 
-        dice_roll = rd.randint(1, 6)
+        outcome = _DICE.step(None, up, get_rng())
         print()
-        print(f"You rolled a {dice_roll}.")
-        if dice_roll == up:
+        print(f"You rolled a {outcome.draw}.")
+        if outcome.result == WIN:
             update_and_persist_stats("dice", "win")
             print("Nice, you guessed it.")
         else:
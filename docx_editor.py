@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Sequence
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from copy import deepcopy
+from itertools import accumulate, chain
 from pathlib import Path
 from typing import Any
 
@@ -11,10 +14,20 @@ from docx import Document as _DocumentFactory
 from docx.document import Document as DocxDocument
 from docx.oxml.ns import qn
 from docx.table import Table
-from docx.text.paragraph import Paragraph
+from lxml.etree import SubElement
 
 _W_P = qn("w:p")
+_W_R = qn("w:r")
+_W_T = qn("w:t")
+_W_TAB = qn("w:tab")
+_W_BR = qn("w:br")
+_W_CR = qn("w:cr")
 _W_TBL = qn("w:tbl")
+_W_TR = qn("w:tr")
+_W_TC = qn("w:tc")
+_XML_SPACE = qn("xml:space")
+_SEPARATORS = {_W_TAB: "\t", _W_BR: "\n", _W_CR: "\n"}
+_RUN_BREAKS = re.compile(r"([\t\r\n])")
 
 
 def create_document() -> DocxDocument:
@@ -60,59 +73,259 @@ def _normalize_index(index: int, length: int) -> int:
     return index
 
 
+def _write_cell(tc: Any, value: Any) -> None:
+    """Write `value` into a new, empty cell.
+
+    Produces the same XML as python-docx's `_Cell.text` setter (tabs become
+    `w:tab`, line breaks `w:br`) but appends to the cell's existing empty
+    paragraph instead of rebuilding it and locating the cell in the grid.
+    """
+    run = SubElement(tc[-1], _W_R)
+    for piece in _RUN_BREAKS.split("" if value is None else str(value)):
+        if piece == "\t":
+            SubElement(run, _W_TAB)
+        elif piece in ("\r", "\n"):
+            SubElement(run, _W_BR)
+        elif piece:
+            node = SubElement(run, _W_T)
+            node.text = piece
+            if piece != piece.strip():
+                node.set(_XML_SPACE, "preserve")
+
+
+def _fill_row(tr: Any, values: Sequence[Any]) -> None:
+    for tc, value in zip(tr.iterchildren(_W_TC), values):
+        _write_cell(tc, value)
+
+
+def append_rows(
+    table: Table,
+    rows: Iterable[Iterable[Any]],
+    *,
+    index: TableIndex | None = None,
+) -> int:
+    """Append rows of values to `table`, consuming `rows` lazily.
+
+    The first new row comes from `Table.add_row()`; the rest are copies of it,
+    so long tables stream in without rebuilding the cell grid per value.
+    """
+    columns = len(table._tbl.tblGrid.gridCol_lst)
+    template = None
+    added = 0
+    for values in rows:
+        values = list(values)
+        if len(values) > columns:
+            raise ValueError(f"Row {added} has {len(values)} values for {columns} columns.")
+        if template is None:
+            tr = table.add_row()._tr
+            template = deepcopy(tr)
+        else:
+            tr = deepcopy(template)
+            table._tbl.append(tr)
+        _fill_row(tr, values)
+        added += 1
+    if added and index is not None:
+        index._changed(table._tbl)
+    return added
+
+
 def add_table(
     document: DocxDocument,
     *,
     rows: int | None = None,
     cols: int | None = None,
-    data: Sequence[Sequence[Any]] | None = None,
+    data: Sequence[Sequence[Any]] | Iterable[Iterable[Any]] | None = None,
     position: int | None = None,
     style: str | None = None,
+    index: TableIndex | None = None,
 ) -> Table:
-    """Add a table, either by fixed size or inferred from `data`."""
+    """Add a table, either by fixed size or inferred from `data`.
+
+    When `data` is a one-shot iterator and `cols` is given, rows are appended
+    as they arrive (padded with empty rows up to `rows`) instead of being
+    listed first; without `cols` the rows are listed to size the table.
+    """
+    _check_index(document, index)
     if rows is not None and rows < 0:
         raise ValueError("rows must be >= 0")
     if cols is not None and cols < 0:
         raise ValueError("cols must be >= 0")
 
-    rows_data = [list(row) for row in data] if data else []
-    inferred_rows = len(rows_data)
-    inferred_cols = max((len(row) for row in rows_data), default=0)
-
-    target_rows = max(rows or 0, inferred_rows)
-    target_cols = max(cols or 0, inferred_cols)
-    if target_rows <= 0 or target_cols <= 0:
-        raise ValueError("Need rows/cols or non-empty data to size the table.")
-
-    existing_blocks = _body_block_elements(document)
-
-    table = document.add_table(rows=target_rows, cols=target_cols)
+    if data is not None and not isinstance(data, Sequence) and not cols:
+        data = list(data)
+    if data is not None and not isinstance(data, Sequence):
+        rows_data: Iterable[Iterable[Any]] = iter(data)
+        first = next(rows_data, None)
+        if first is None and not rows:
+            raise ValueError("Need rows/cols or non-empty data to size the table.")
+        if first is not None:
+            rows_data = chain([first], rows_data)
+        target_cols = cols
+    else:
+        rows_data = [list(row) for row in data] if data else []
+        target_rows = max(rows or 0, len(rows_data))
+        target_cols = max(cols or 0, max((len(row) for row in rows_data), default=0))
+        if target_rows <= 0 or target_cols <= 0:
+            raise ValueError("Need rows/cols or non-empty data to size the table.")
+
+    existing_blocks = _body_block_elements(document) if position is not None else []
+
+    # Rows with data are appended from one template row; the rest stay blank.
+    table = document.add_table(rows=0 if data else rows or 0, cols=target_cols)
     if style:
         table.style = style
-
-    for row_idx, row_values in enumerate(rows_data):
-        for col_idx, value in enumerate(row_values):
-            table.cell(row_idx, col_idx).text = "" if value is None else str(value)
-
+    if data:
+        try:
+            added = append_rows(table, rows_data)
+        except ValueError:
+            _remove_table(table)
+            raise
+        append_rows(table, ([] for _ in range((rows or 0) - added)))
+
+    at_end = True
     if position is not None:
         target_position = _normalize_insert_index(position, len(existing_blocks))
         if target_position < len(existing_blocks):
             existing_blocks[target_position].addprevious(table._tbl)
+            at_end = False
 
+    if index is not None:
+        index._added(table._tbl, at_end=at_end)
     return table
 
 
-def _remove_table(table: Table) -> None:
+def _remove_table(table: Table, index: TableIndex | None = None) -> None:
     table_xml = table._tbl
     parent = table_xml.getparent()
     if parent is not None:
         parent.remove(table_xml)
+    if index is not None:
+        index._forget(table_xml)
 
 
 def _table_text(table: Table) -> str:
     return "\n".join(cell.text for row in table.rows for cell in row.cells)
 
 
+class TableIndex:
+    """Cached text of a document's top-level tables for repeated table lookups.
+
+    Each table's text is built once; searches run `str.find` over one joined
+    haystack instead of re-reading every cell. Pass the index to the editing
+    helpers (`index=`) so it follows their edits; after changing tables any
+    other way, call `refresh()`.
+    """
+
+    def __init__(self, document: DocxDocument) -> None:
+        self.document = document
+        self._texts: dict[Any, str] = {}
+        self._order: list[Any] | None = None
+        # case_sensitive -> (haystack, start offsets, elements) as of the last build.
+        self._haystacks: dict[bool, tuple[str, list[int], list[Any]]] = {}
+        self._removed: set[Any] = set()
+        # Deleted tables still in `_order`; pruned in one pass on the next read.
+        self._dropped: set[Any] = set()
+
+    def refresh(self) -> None:
+        self._texts.clear()
+        self._order = None
+        self._haystacks.clear()
+        self._removed.clear()
+        self._dropped.clear()
+
+    def __len__(self) -> int:
+        return len(self._elements())
+
+    def table(self, table_index: int) -> Table:
+        elements = self._elements()
+        return Table(elements[_normalize_index(table_index, len(elements))], self.document._body)
+
+    def text(self, table: Table) -> str:
+        return self._text(table._tbl)
+
+    def find(self, text: str, *, case_sensitive: bool = False, remove_all: bool = True) -> list[Table]:
+        """Tables whose text contains `text`, in document order."""
+        haystack, offsets, elements = self._haystack(case_sensitive)
+        if not elements:
+            return []
+        needle = text if case_sensitive else text.lower()
+        found = []
+        start = 0
+        while True:
+            hit = haystack.find(needle, start)
+            if hit < 0:
+                break
+            position = bisect_right(offsets, hit) - 1
+            start = offsets[position + 1]
+            if elements[position] in self._removed:
+                continue
+            found.append(Table(elements[position], self.document._body))
+            if not remove_all:
+                break
+        return found
+
+    def _elements(self) -> list[Any]:
+        if self._order is None:
+            self._order = list(self.document._body._element.iterchildren(_W_TBL))
+            self._dropped.clear()
+        elif self._dropped:
+            self._order = [element for element in self._order if element not in self._dropped]
+            self._dropped.clear()
+        return self._order
+
+    def _text(self, element: Any) -> str:
+        text = self._texts.get(element)
+        if text is None:
+            text = self._texts[element] = _table_text(Table(element, self.document._body))
+        return text
+
+    def _haystack(self, case_sensitive: bool) -> tuple[str, list[int], list[Any]]:
+        built = self._haystacks.get(case_sensitive)
+        if built is None:
+            elements = [element for element in self._elements() if element not in self._removed]
+            texts = [self._text(element) for element in elements]
+            if not case_sensitive:
+                texts = [text.lower() for text in texts]
+            # NUL cannot appear in document text, so matches never span two tables.
+            offsets = list(accumulate((len(text) + 1 for text in texts), initial=0))
+            built = self._haystacks[case_sensitive] = ("\0".join(texts), offsets, elements)
+        return built
+
+    def _forget(self, element: Any) -> None:
+        self._texts.pop(element, None)
+        if self._order is not None:
+            self._dropped.add(element)
+        # Built haystacks keep their offsets; removed tables are skipped instead.
+        self._removed.add(element)
+
+    def _added(self, element: Any, *, at_end: bool) -> None:
+        if self._order is not None:
+            if at_end:
+                self._elements().append(element)
+            else:
+                self._order = None
+        self._haystacks.clear()
+        self._removed.clear()
+
+    def _changed(self, element: Any) -> None:
+        if self._texts.pop(element, None) is not None:
+            self._haystacks.clear()
+            self._removed.clear()
+
+
+def _check_index(document: DocxDocument, index: TableIndex | None) -> None:
+    if index is not None and index.document is not document:
+        raise ValueError("The table index belongs to a different document.")
+
+
+def _touch_table(index: TableIndex, paragraph: Any) -> None:
+    top = None
+    for ancestor in paragraph.iterancestors(_W_TBL):
+        top = ancestor
+    if top is not None:
+        index._changed(top)
+
+
 def delete_table(
     document: DocxDocument,
     *,
@@ -120,20 +333,34 @@ def delete_table(
     contains_text: str | None = None,
     case_sensitive: bool = False,
     remove_all: bool = False,
+    index: TableIndex | None = None,
 ) -> int:
-    """Delete table(s) by index or by a text match."""
+    """Delete table(s) by index or by a text match.
+
+    With a `TableIndex`, lookups use its cached table text instead of reading
+    every table again.
+    """
+    _check_index(document, index)
     by_index = table_index is not None
     by_text = contains_text is not None
     if by_index == by_text:
         raise ValueError("Specify exactly one of table_index or contains_text.")
 
     if by_index:
+        if index is not None:
+            _remove_table(index.table(table_index), index)
+            return 1
         tables = list(document.tables)
-        index = _normalize_index(table_index, len(tables))
-        _remove_table(tables[index])
+        _remove_table(tables[_normalize_index(table_index, len(tables))])
         return 1
 
     assert contains_text is not None
+    if index is not None:
+        matches = index.find(contains_text, case_sensitive=case_sensitive, remove_all=remove_all)
+        for table in matches:
+            _remove_table(table, index)
+        return len(matches)
+
     needle = contains_text if case_sensitive else contains_text.lower()
     matches: list[Table] = []
     for table in list(document.tables):
@@ -150,40 +377,103 @@ def delete_table(
     return len(matches)
 
 
-def _iter_paragraphs(document: DocxDocument, include_tables: bool) -> list[Paragraph]:
-    paragraphs = list(document.paragraphs)
+def _iter_paragraph_elements(document: DocxDocument, include_tables: bool) -> Iterator[Any]:
+    """Yield `w:p` elements lazily, in document order, each exactly once."""
+    body = document._body._element
     if not include_tables:
-        return paragraphs
-
-    seen = {id(paragraph) for paragraph in paragraphs}
-    for table in document.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    paragraph_id = id(paragraph)
-                    if paragraph_id in seen:
-                        continue
-                    seen.add(paragraph_id)
-                    paragraphs.append(paragraph)
-    return paragraphs
-
-
-def _replace_in_paragraph(paragraph: Paragraph, pattern: re.Pattern[str]) -> int:
-    if not paragraph.runs:
-        updated, replaced = pattern.subn("", paragraph.text)
-        if replaced:
-            paragraph.text = updated
-        return replaced
-
-    total = 0
-    for run in paragraph.runs:
-        if not run.text:
+        return body.iterchildren(_W_P)
+    # Only body -> tbl -> tr -> tc chains: text boxes (written twice, under
+    # mc:Choice and mc:Fallback) and content controls are left alone.
+    return _iter_flow_paragraphs(body)
+
+
+def _iter_flow_paragraphs(container: Any) -> Iterator[Any]:
+    for child in container.iterchildren(_W_P, _W_TBL):
+        if child.tag == _W_P:
+            yield child
+            continue
+        for row in child.iterchildren(_W_TR):
+            for cell in row.iterchildren(_W_TC):
+                yield from _iter_flow_paragraphs(cell)
+
+
+def _run_content(paragraph: Any) -> Iterator[tuple[Any, str | None]]:
+    """Yield `(node, separator)` for run text owned by this paragraph.
+
+    `w:t` nodes come with `None`; tabs and breaks come with the character
+    python-docx uses for them so matches cannot silently join across them.
+    Paragraphs nested inside this one (text boxes) are left to their own pass.
+    """
+    for node in paragraph.iter(_W_T, _W_TAB, _W_BR, _W_CR):
+        if node.getparent().tag != _W_R or next(node.iterancestors(_W_P), None) is not paragraph:
+            continue
+        yield node, None if node.tag == _W_T else _SEPARATORS[node.tag]
+
+
+def _set_node_text(node: Any, text: str) -> None:
+    node.text = text
+    if text != text.strip():
+        node.set(_XML_SPACE, "preserve")
+
+
+def _replace_in_paragraph(paragraph: Any, pattern: re.Pattern[str]) -> list[re.Match[str]]:
+    """Delete matches of `pattern` from the paragraph text, even across runs.
+
+    The pattern runs once over the concatenated text; each match is mapped back
+    to the `w:t` nodes it covers and only those nodes are rewritten. Matches
+    that would cover a tab or break are left alone. Returns the applied matches.
+    """
+    nodes = []
+    pieces = []
+    for node, separator in _run_content(paragraph):
+        text = (node.text or "") if separator is None else separator
+        if text:
+            nodes.append(None if separator is not None else node)
+            pieces.append(text)
+    if not pieces:
+        return []
+    if len(pieces) == 1:
+        if nodes[0] is None:
+            return []
+        matches = list(pattern.finditer(pieces[0]))
+        if matches:
+            _set_node_text(nodes[0], pattern.sub("", pieces[0]))
+        return matches
+
+    matches = list(pattern.finditer("".join(pieces)))
+    if not matches:
+        return []
+
+    offsets = list(accumulate((len(piece) for piece in pieces), initial=0))
+    cuts: dict[int, list[tuple[int, int]]] = {}
+    applied = []
+    for match in matches:
+        start, end = match.span()
+        first = bisect_right(offsets, start) - 1
+        last = bisect_left(offsets, end) - 1
+        if any(nodes[index] is None for index in range(first, last + 1)):
             continue
-        updated, replaced = pattern.subn("", run.text)
-        if replaced:
-            run.text = updated
-            total += replaced
-    return total
+        for index in range(first, last + 1):
+            cuts.setdefault(index, []).append(
+                (max(start, offsets[index]) - offsets[index], min(end, offsets[index + 1]) - offsets[index])
+            )
+        applied.append(match)
+
+    for index, spans in cuts.items():
+        text = pieces[index]
+        kept = []
+        position = 0
+        for low, high in spans:
+            kept.append(text[position:low])
+            position = high
+        kept.append(text[position:])
+        _set_node_text(nodes[index], "".join(kept))
+    return applied
+
+
+def _text_pattern(text: str, *, case_sensitive: bool, whole_word: bool) -> str:
+    pattern_text = rf"\b{re.escape(text)}\b" if whole_word else re.escape(text)
+    return pattern_text if case_sensitive else f"(?i:{pattern_text})"
 
 
 def delete_text(
@@ -193,30 +483,39 @@ def delete_text(
     case_sensitive: bool = False,
     whole_word: bool = False,
     include_tables: bool = True,
+    index: TableIndex | None = None,
 ) -> int:
-    """Delete matching text from paragraphs and optionally table cells."""
+    """Delete matching text from paragraphs and optionally table cells.
+
+    Walks the document XML once, editing `w:t` nodes in place, so no
+    python-docx paragraph or cell objects are built. Matches may span runs.
+    """
+    _check_index(document, index)
     if not text:
         return 0
 
-    pattern_text = rf"\b{re.escape(text)}\b" if whole_word else re.escape(text)
-    flags = 0 if case_sensitive else re.IGNORECASE
-    pattern = re.compile(pattern_text, flags)
+    pattern = re.compile(_text_pattern(text, case_sensitive=case_sensitive, whole_word=whole_word))
 
     replacements = 0
-    for paragraph in _iter_paragraphs(document, include_tables=include_tables):
-        replacements += _replace_in_paragraph(paragraph, pattern)
+    for paragraph in _iter_paragraph_elements(document, include_tables=include_tables):
+        replaced = len(_replace_in_paragraph(paragraph, pattern))
+        if replaced and index is not None:
+            _touch_table(index, paragraph)
+        replacements += replaced
     return replacements
 
 
-def delete_block(document: DocxDocument, block_index: int) -> str:
+def delete_block(document: DocxDocument, block_index: int, *, index: TableIndex | None = None) -> str:
     """Delete a paragraph or table by body-flow index."""
+    _check_index(document, index)
     blocks = _body_block_elements(document)
-    index = _normalize_index(block_index, len(blocks))
-    block = blocks[index]
+    block = blocks[_normalize_index(block_index, len(blocks))]
     block_type = "table" if block.tag == _W_TBL else "paragraph"
     parent = block.getparent()
     if parent is not None:
         parent.remove(block)
+    if index is not None and block_type == "table":
+        index._forget(block)
     return block_type
 
 
@@ -231,6 +530,7 @@ def delete_content(
     whole_word: bool = False,
     include_tables_for_text: bool = True,
     remove_all_matching_tables: bool = False,
+    index: TableIndex | None = None,
 ) -> int:
     """Delete text, table, or a single flow block using one selector."""
     selectors = [
@@ -249,24 +549,152 @@ def delete_content(
             case_sensitive=case_sensitive,
             whole_word=whole_word,
             include_tables=include_tables_for_text,
+            index=index,
         )
     if table_index is not None:
-        return delete_table(document, table_index=table_index)
+        return delete_table(document, table_index=table_index, index=index)
     if table_contains_text is not None:
         return delete_table(
             document,
             contains_text=table_contains_text,
             case_sensitive=case_sensitive,
             remove_all=remove_all_matching_tables,
+            index=index,
         )
 
     assert block_index is not None
-    delete_block(document, block_index)
+    delete_block(document, block_index, index=index)
     return 1
 
 
+class EditPlan:
+    """Collect deletions and apply them together with one walk of the document.
+
+    Selectors are resolved against the document as it is when `apply` runs:
+    block and table indices refer to the unedited body, and table text matches
+    see the original text. Tables and blocks are removed first; then every text
+    selector is folded into one alternation regex, where earlier selectors win
+    when two matches start at the same place. `apply` returns one count per
+    selector, in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        self._selectors: list[tuple[str, dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._selectors)
+
+    def delete_text(
+        self,
+        text: str,
+        *,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        include_tables: bool = True,
+    ) -> EditPlan:
+        self._selectors.append(
+            (
+                "text",
+                {
+                    "text": text,
+                    "case_sensitive": case_sensitive,
+                    "whole_word": whole_word,
+                    "include_tables": include_tables,
+                },
+            )
+        )
+        return self
+
+    def delete_table(
+        self,
+        *,
+        table_index: int | None = None,
+        contains_text: str | None = None,
+        case_sensitive: bool = False,
+        remove_all: bool = False,
+    ) -> EditPlan:
+        if (table_index is None) == (contains_text is None):
+            raise ValueError("Specify exactly one of table_index or contains_text.")
+        self._selectors.append(
+            (
+                "table",
+                {
+                    "table_index": table_index,
+                    "contains_text": contains_text,
+                    "case_sensitive": case_sensitive,
+                    "remove_all": remove_all,
+                },
+            )
+        )
+        return self
+
+    def delete_block(self, block_index: int) -> EditPlan:
+        self._selectors.append(("block", {"block_index": block_index}))
+        return self
+
+    def apply(self, document: DocxDocument, index: TableIndex | None = None) -> list[int]:
+        _check_index(document, index)
+        body = document._body._element
+        blocks = _body_block_elements(document)
+        tables = index if index is not None else TableIndex(document)
+        counts = [0] * len(self._selectors)
+        doomed: dict[Any, None] = {}
+
+        # Resolve (and validate) every removal before anything changes.
+        for position, (kind, options) in enumerate(self._selectors):
+            if kind == "block":
+                doomed[blocks[_normalize_index(options["block_index"], len(blocks))]] = None
+                counts[position] = 1
+            elif kind == "table" and options["table_index"] is not None:
+                doomed[tables.table(options["table_index"])._tbl] = None
+                counts[position] = 1
+            elif kind == "table":
+                found = tables.find(
+                    options["contains_text"],
+                    case_sensitive=options["case_sensitive"],
+                    remove_all=options["remove_all"],
+                )
+                doomed.update(dict.fromkeys(table._tbl for table in found))
+                counts[position] = len(found)
+
+        for element in doomed:
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
+            if element.tag == _W_TBL:
+                tables._forget(element)
+
+        body_groups = []
+        nested_groups = []
+        for position, (kind, options) in enumerate(self._selectors):
+            if kind != "text" or not options["text"]:
+                continue
+            group = f"(?P<s{position}>" + _text_pattern(
+                options["text"], case_sensitive=options["case_sensitive"], whole_word=options["whole_word"]
+            ) + ")"
+            body_groups.append(group)
+            if options["include_tables"]:
+                nested_groups.append(group)
+        if not body_groups:
+            return counts
+
+        body_pattern = re.compile("|".join(body_groups))
+        nested_pattern = re.compile("|".join(nested_groups)) if nested_groups else None
+        for paragraph in _iter_paragraph_elements(document, include_tables=nested_pattern is not None):
+            pattern = body_pattern if paragraph.getparent() is body else nested_pattern
+            matches = _replace_in_paragraph(paragraph, pattern)
+            for match in matches:
+                counts[int(match.lastgroup[1:])] += 1
+            if matches and pattern is nested_pattern:
+                _touch_table(tables, paragraph)
+        return counts
+
+
 __all__ = [
+    "EditPlan",
+    "TableIndex",
     "add_table",
+    "append_rows",
     "create_document",
     "delete_block",
     "delete_content",
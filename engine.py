@@ -0,0 +1,178 @@
+"""Headless game rules shared by the CLI, the Flask app and batch tooling.
+
+Every game exposes `step(state, move, rng) -> Outcome`. Nothing here reads
+input or prints, so a round can be replayed millions of times with any RNG
+that offers `randint`, `choice` and `random` (the `random` module works as-is).
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple, Protocol
+
+WIN = "win"
+LOSS = "loss"
+TIE = "tie"
+PENDING = "pending"
+
+COIN_SIDES = ("Heads", "Tails")
+RPS_CHOICES = ("Rock", "Paper", "Scissors")
+RPS_BEATS = {"Rock": "Scissors", "Paper": "Rock", "Scissors": "Paper"}
+METEOR_LANES = ("Left", "Center", "Right")
+
+
+class RandomSource(Protocol):
+    def randint(self, a: int, b: int) -> int: ...
+
+    def choice(self, seq): ...
+
+    def random(self) -> float: ...
+
+
+class Outcome(NamedTuple):
+    result: str
+    move: Any
+    draw: Any
+    state: Any = None
+
+
+class GuessState(NamedTuple):
+    target: int
+    tries_left: int
+
+
+def rps_result(user_choice: str, comp_choice: str) -> str:
+    if user_choice == comp_choice:
+        return TIE
+    return WIN if RPS_BEATS[user_choice] == comp_choice else LOSS
+
+
+def hint(guess: int, target: int) -> str:
+    return "higher" if target > guess else "lower"
+
+
+class Game(ABC):
+    key = ""
+    choices: tuple = ()
+    __slots__ = ()
+
+    def new_state(self, rng: RandomSource) -> Any:
+        return None
+
+    @abstractmethod
+    def step(self, state: Any, move: Any, rng: RandomSource) -> Outcome: ...
+
+
+class DiceGame(Game):
+    key = "dice"
+    choices = (1, 2, 3, 4, 5, 6)
+    __slots__ = ()
+    _LOG_MISS = math.log(5 / 6)
+
+    def step(self, state: Any, move: int, rng: RandomSource) -> Outcome:
+        roll = rng.randint(1, 6)
+        return Outcome(WIN if roll == move else LOSS, move, roll)
+
+    def sample_attempts(self, rng: RandomSource) -> int:
+        """Rolls needed to hit a chosen face, drawn from Geometric(1/6) with one RNG call."""
+        return int(math.log1p(-rng.random()) / self._LOG_MISS) + 1
+
+    def iter_rolls(self, move: int, attempts: int, rng: RandomSource) -> Iterator[int]:
+        """Lazily replay a run of `attempts` rolls that ends on `move`.
+
+        Given the attempt count, each miss is uniform over the other five faces,
+        so the transcript has the same distribution as rolling one die at a time.
+        """
+        misses = tuple(face for face in self.choices if face != move)
+        for _ in range(attempts - 1):
+            yield rng.choice(misses)
+        yield move
+
+
+class CoinGame(Game):
+    key = "coin"
+    choices = COIN_SIDES
+    __slots__ = ()
+
+    def step(self, state: Any, move: str, rng: RandomSource) -> Outcome:
+        landed = rng.choice(COIN_SIDES)
+        return Outcome(WIN if landed == move else LOSS, move, landed)
+
+
+class RpsGame(Game):
+    key = "rps"
+    choices = RPS_CHOICES
+    __slots__ = ()
+
+    def step(self, state: Any, move: str, rng: RandomSource) -> Outcome:
+        comp_choice = rng.choice(RPS_CHOICES)
+        return Outcome(rps_result(move, comp_choice), move, comp_choice)
+
+
+class MeteorGame(Game):
+    key = "meteor"
+    choices = METEOR_LANES
+    __slots__ = ()
+
+    def step(self, state: Any, move: str, rng: RandomSource) -> Outcome:
+        incoming = rng.choice(METEOR_LANES)
+        return Outcome(LOSS if incoming == move else WIN, move, incoming)
+
+
+class PlanetGame(Game):
+    key = "planet"
+    choices = (1, 2, 3, 4, 5, 6, 7, 8)
+    __slots__ = ()
+
+    def step(self, state: Any, move: int, rng: RandomSource) -> Outcome:
+        target = rng.randint(1, 8)
+        return Outcome(WIN if target == move else LOSS, move, target)
+
+
+class GuessGame(Game):
+    """Number Guess: find a 1-10 target within three tries.
+
+    A miss with tries remaining is `PENDING` and carries the narrowed state;
+    a finished round (win or loss) carries a freshly drawn state.
+    """
+
+    key = "guess"
+    choices = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+    max_tries = 3
+    __slots__ = ()
+
+    def new_state(self, rng: RandomSource) -> GuessState:
+        return GuessState(rng.randint(1, 10), self.max_tries)
+
+    def attempts_used(self, state: GuessState) -> int:
+        return self.max_tries - state.tries_left + 1
+
+    def step(self, state: GuessState, move: int, rng: RandomSource) -> Outcome:
+        if move == state.target:
+            return Outcome(WIN, move, state.target, self.new_state(rng))
+        tries_left = state.tries_left - 1
+        if tries_left <= 0:
+            return Outcome(LOSS, move, state.target, self.new_state(rng))
+        return Outcome(PENDING, move, state.target, GuessState(state.target, tries_left))
+
+
+ENGINES: dict[str, Game] = {
+    game.key: game
+    for game in (DiceGame(), CoinGame(), RpsGame(), MeteorGame(), PlanetGame(), GuessGame())
+}
+
+
+def tally(game: str, moves: Iterable[Any], rng: RandomSource) -> Counter:
+    """Play one step per move and count the results, threading state through."""
+    engine = ENGINES[game]
+    step = engine.step
+    state = engine.new_state(rng)
+    counts: Counter = Counter()
+    for move in moves:
+        outcome = step(state, move, rng)
+        state = outcome.state
+        counts[outcome.result] += 1
+    return counts
@@ -1,11 +1,58 @@
-from dice_roll import continuous_game_dice_roll as dr
-from coin_flip import continuous_game_coin_flip as cf
-from rock_paper_scissors import game_rock_paper_scissors as rps
+import sys
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 from cli_utils import prompt_nonempty, prompt_yes_no, run_global_command
-from stats import format_stats_summary, load_stats
-from number_guess import game_number_guess as ng
 
-def run_cli():
+_IMPORT_FINISHED = time.perf_counter()
+
+# Menu number -> (module, entry point, intro). Game modules are imported on
+# first pick so launching the menu only loads `cli_utils`.
+MENU = {
+    1: ("dice_roll", "continuous_game_dice_roll", "Dice Roll: guess a number and keep rolling until it matches."),
+    2: ("coin_flip", "continuous_game_coin_flip", "Coin Flip: call heads or tails and test your luck."),
+    3: ("rock_paper_scissors", "game_rock_paper_scissors", "Rock Paper Scissors: beat the computer in a best-of-3."),
+    4: ("number_guess", "game_number_guess", "Number Guess: guess a number from 1 to 10 in 3 tries."),
+}
+HEAVY_MODULES = ("docx", "lxml", "flask", "numpy")
+USAGE = "usage: luck-arcade [--profile-startup]"
+
+
+def _load_game(choice: int):
+    from importlib import import_module
+
+    module_name, entry_point, _ = MENU[choice]
+    return getattr(import_module(module_name), entry_point)
+
+
+def _print_stats() -> None:
+    from stats import format_stats_summary, load_stats
+
+    print(f"\n{format_stats_summary(load_stats())}")
+
+
+def profile_startup() -> str:
+    """Report how long the menu took to import and what each game adds on first pick."""
+    lines = [f"menu imports: {(_IMPORT_FINISHED - _IMPORT_STARTED) * 1000:.1f} ms"]
+    heavy = [name for name in HEAVY_MODULES if name in sys.modules]
+    lines.append(f"heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+    for choice, (module_name, _, _) in MENU.items():
+        started = time.perf_counter()
+        _load_game(choice)
+        lines.append(f"  pick {choice} ({module_name}): +{(time.perf_counter() - started) * 1000:.1f} ms")
+    return "\n".join(lines)
+
+
+def run_cli(argv: list[str] | None = None):
+    args = sys.argv[1:] if argv is None else argv
+    if args == ["--profile-startup"]:
+        print(profile_startup())
+        return 0
+    if args:
+        print(USAGE)
+        return 0 if args[0] in ("-h", "--help") else 2
+
     print("Welcome to Luck Arcade!")
     print("Nothing fancy here, just quick luck-based games.")
 
@@ -32,7 +79,7 @@ def run_cli():
                 print("\nType 1, 2, 3, or 4 to play."),
                 print("Commands: help, stats, quit."),
             ),
-            on_stats=lambda: print(f"\n{format_stats_summary(load_stats())}"),
+            on_stats=_print_stats,
         )
         if signal == "quit":
             print("Goodbye!")
@@ -46,21 +93,11 @@ def run_cli():
             print("That is not a number. Try again with 1, 2, 3, or 4.")
             continue
 
-        if choice == 1:
-            print("\nDice Roll: guess a number and keep rolling until it matches.")
-            dr()
-        elif choice == 2:
-            print("\nCoin Flip: call heads or tails and test your luck.")
-            cf()
-        elif choice == 3:
-            print("\nRock Paper Scissors: beat the computer in a best-of-3.")
-            rps()
-        elif choice == 4:
-            print("\nNumber Guess: guess a number from 1 to 10 in 3 tries.")
-            ng()
-        else:
+        if choice not in MENU:
             print("Only 1, 2, 3, or 4 works here.")
             continue
+        print(f"\n{MENU[choice][2]}")
+        _load_game(choice)()
 
         again = prompt_yes_no('\nReturn to main menu? (y/n): ', allow_quit=True)
         if again is True:
@@ -70,4 +107,4 @@ def run_cli():
 
 
 if __name__ == "__main__":
-    run_cli()
+    raise SystemExit(run_cli())
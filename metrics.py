@@ -0,0 +1,275 @@
+"""Prometheus-text metrics for the Flask app.
+
+Off unless `LUCK_ARCADE_METRICS=1`; when off nothing is hooked in and `/metrics`
+does not exist. Each process keeps its own numbers, so scrape every worker.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+
+from flask import Flask, g, request
+from flask.sessions import SessionInterface
+from flask.signals import before_render_template, template_rendered
+
+import stats
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last slot is +Inf), sum]
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return 0 if series is None else sum(series[0])
+
+    def samples(self):
+        with self._lock:
+            items = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._series.items())
+        for labels, (counts, total) in items:
+            running = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                running += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{_number(bound)}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {running}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {running}"
+
+
+class Gauge:
+    """A value read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        self.name = name
+        self.help = help_text
+        self.read = read
+
+    def samples(self):
+        yield f"{self.name} {_number(self.read())}"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.metrics: list = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+class TimedRandom:
+    """Wrap an RNG provider and time every draw."""
+
+    __slots__ = ("_inner", "_histogram")
+
+    def __init__(self, inner, histogram: Histogram) -> None:
+        self._inner = inner
+        self._histogram = histogram
+
+    def randint(self, a: int, b: int) -> int:
+        started = time.perf_counter()
+        value = self._inner.randint(a, b)
+        self._histogram.observe(time.perf_counter() - started, "randint")
+        return value
+
+    def choice(self, seq):
+        started = time.perf_counter()
+        value = self._inner.choice(seq)
+        self._histogram.observe(time.perf_counter() - started, "choice")
+        return value
+
+    def random(self) -> float:
+        started = time.perf_counter()
+        value = self._inner.random()
+        self._histogram.observe(time.perf_counter() - started, "random")
+        return value
+
+
+class TimedSessionInterface(SessionInterface):
+    """Delegate to another session interface, timing open/save and sizing the cookie."""
+
+    def __init__(self, inner: SessionInterface, histogram: Histogram, cookie_bytes: Histogram) -> None:
+        self.inner = inner
+        self.histogram = histogram
+        self.cookie_bytes = cookie_bytes
+
+    def open_session(self, app, request):
+        started = time.perf_counter()
+        try:
+            return self.inner.open_session(app, request)
+        finally:
+            self.histogram.observe(time.perf_counter() - started, "open")
+
+    def save_session(self, app, session, response) -> None:
+        started = time.perf_counter()
+        try:
+            self.inner.save_session(app, session, response)
+        finally:
+            self.histogram.observe(time.perf_counter() - started, "save")
+        prefix = f"{self.inner.get_cookie_name(app)}="
+        for header in response.headers.getlist("Set-Cookie"):
+            if header.startswith(prefix):
+                self.cookie_bytes.observe(len(header[len(prefix):].split(";", 1)[0]))
+
+    def make_null_session(self, app):
+        return self.inner.make_null_session(app)
+
+    def is_null_session(self, obj) -> bool:
+        return self.inner.is_null_session(obj)
+
+
+class Metrics:
+    def __init__(self, stats_pending: Callable[[], float] = lambda: 0) -> None:
+        self.registry = Registry()
+        add = self.registry.add
+        self.requests = add(Counter("luck_arcade_requests_total", "HTTP requests.", ("route", "method", "status")))
+        self.latency = add(
+            Histogram("luck_arcade_request_seconds", "Request latency by route.", ("route", "method"))
+        )
+        self.render = add(
+            Histogram("luck_arcade_template_render_seconds", "Template render time.", ("template",))
+        )
+        self.session_io = add(
+            Histogram("luck_arcade_session_seconds", "Session load/save time.", ("op",))
+        )
+        self.cookie_bytes = add(
+            Histogram("luck_arcade_session_cookie_bytes", "Size of Set-Cookie session values.", buckets=SIZE_BUCKETS)
+        )
+        self.stats_io = add(
+            Histogram("luck_arcade_stats_io_seconds", "Stats storage reads and flushes.", ("op",))
+        )
+        self.rng = add(Histogram("luck_arcade_rng_seconds", "Time per RNG draw.", ("call",)))
+        self.plays = add(Counter("luck_arcade_plays_total", "Rounds played.", ("game", "result")))
+        add(Gauge("luck_arcade_stats_pending", "Rounds queued for the next stats flush.", stats_pending))
+        self._render_starts = threading.local()
+
+    def timed_rng(self, rng) -> TimedRandom:
+        return TimedRandom(rng, self.rng)
+
+    def observe_stats_io(self, op: str, seconds: float) -> None:
+        self.stats_io.observe(seconds, op)
+
+    def install(self, app: Flask) -> None:
+        app.session_interface = TimedSessionInterface(app.session_interface, self.session_io, self.cookie_bytes)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        before_render_template.connect(self._before_render, app, weak=False)
+        template_rendered.connect(self._after_render, app, weak=False)
+        stats.set_io_observer(self.observe_stats_io)
+        app.add_url_rule("/metrics", "metrics", self._endpoint)
+
+    def _endpoint(self):
+        return self.registry.render(), 200, {"Content-Type": CONTENT_TYPE}
+
+    def _before_request(self) -> None:
+        g.metrics_started = time.perf_counter()
+
+    def _after_request(self, response):
+        started = g.pop("metrics_started", None)
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        if started is not None:
+            self.latency.observe(time.perf_counter() - started, route, request.method)
+        self.requests.inc(route, request.method, str(response.status_code))
+        return response
+
+    def _before_render(self, sender, template, context, **extra) -> None:
+        stack = getattr(self._render_starts, "stack", None)
+        if stack is None:
+            stack = self._render_starts.stack = []
+        stack.append(time.perf_counter())
+
+    def _after_render(self, sender, template, context, **extra) -> None:
+        stack = getattr(self._render_starts, "stack", None)
+        if stack:
+            self.render.observe(time.perf_counter() - stack.pop(), template.name or "<string>")
+
+
+def install_metrics(app: Flask, stats_pending: Callable[[], float] = lambda: 0, enabled: bool | None = None):
+    """Hook metrics into `app` when enabled (default: `LUCK_ARCADE_METRICS=1`); returns None when off."""
+    if enabled is None:
+        enabled = os.environ.get("LUCK_ARCADE_METRICS", "0") == "1"
+    if not enabled:
+        return None
+    metrics = Metrics(stats_pending)
+    metrics.install(app)
+    return metrics
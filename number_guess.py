@@ -1,8 +1,10 @@
-import random as rd
-
 from cli_utils import prompt_nonempty, prompt_yes_no, run_global_command
+from engine import ENGINES, LOSS, PENDING, WIN, hint
+from rng import get_rng
 from stats import update_and_persist_stats
 
+_GUESS = ENGINES["guess"]
+
 
 def game_number_guess():
     print("Number Guess.")
@@ -10,11 +12,10 @@ def game_number_guess():
     print("Commands: help, stats, menu, quit")
 
     while True:
-        target = rd.randint(1, 10)
-        tries = 0
-        won = False
+        state = _GUESS.new_state(get_rng())
+        result = None
 
-        while tries < 3:
+        while result not in (WIN, LOSS):
             raw = prompt_nonempty(
                 'Your guess (1-10) or "quit": ',
                 allow_quit=True,
@@ -49,20 +50,22 @@ def game_number_guess():
                 print("Use a number from 1 to 10.")
                 continue
 
-            tries += 1
+            outcome = _GUESS.step(state, guess, get_rng())
+            result = outcome.result
 
-            if guess == target:
+            if result == WIN:
+                tries = _GUESS.attempts_used(state)
                 print(f"Correct. You got it in {tries} try{'ies' if tries > 1 else ''}.")
                 update_and_persist_stats("guess", "win")
-                won = True
                 break
 
-            hint = "higher" if target > guess else "lower"
-            left = 3 - tries
-            print(f"Not quite. Try {hint}. Attempts left: {left}")
+            left = outcome.state.tries_left if result == PENDING else 0
+            print(f"Not quite. Try {hint(guess, state.target)}. Attempts left: {left}")
+            if result == PENDING:
+                state = outcome.state
 
-        if not won:
-            print(f"Out of tries. The number was {target}.")
+        if result == LOSS:
+            print(f"Out of tries. The number was {state.target}.")
             update_and_persist_stats("guess", "loss")
 
         again = prompt_yes_no("Play Number Guess again? (y/n): ", allow_quit=True)
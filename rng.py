@@ -0,0 +1,103 @@
+"""Random number providers shared by the CLI and the Flask app.
+
+Every provider offers `randint`, `choice` and `random`, which is all the game
+engines need. Pick one with `LUCK_ARCADE_RNG` (python, buffered, secure) and
+seed it with `LUCK_ARCADE_SEED`, or swap it at runtime with `set_rng`.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import secrets
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+RNG_KINDS = ("python", "buffered", "secure")
+_WORD_TYPE = "I" if array("I").itemsize == 4 else "L"
+_WORD_SPAN = 1 << 32
+
+
+class BufferedRandom:
+    """Hand out draws from pre-generated blocks of 32-bit words.
+
+    One `getrandbits` call fills a whole block, so `randint` and `choice` are
+    a loop step plus a rejection check that keeps them free of modulo bias.
+    `random()` comes straight from the seeded source, which is already C speed.
+    """
+
+    def __init__(self, seed: Any = None, block_size: int = 4096) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0")
+        self.block_size = block_size
+        self._source = random.Random(seed)
+        self._words = iter(())
+        self.random = self._source.random
+
+    def _refill(self) -> None:
+        raw = self._source.getrandbits(32 * self.block_size).to_bytes(4 * self.block_size, "little")
+        self._words = iter(array(_WORD_TYPE, raw))
+
+    def randint(self, a: int, b: int) -> int:
+        span = b - a + 1
+        if span <= 0:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        if span > _WORD_SPAN:
+            return a + self._source.randrange(span)
+        limit = _WORD_SPAN - _WORD_SPAN % span
+        while True:
+            for word in self._words:
+                if word < limit:
+                    return a + word % span
+            self._refill()
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        span = len(seq)
+        if not span:
+            raise IndexError("Cannot choose from an empty sequence")
+        if span > _WORD_SPAN:
+            return seq[self._source.randrange(span)]
+        limit = _WORD_SPAN - _WORD_SPAN % span
+        while True:
+            for word in self._words:
+                if word < limit:
+                    return seq[word % span]
+            self._refill()
+
+
+def create_rng(kind: str = "python", seed: Any = None):
+    """Build a provider: `random.Random`, `BufferedRandom` or `secrets.SystemRandom`."""
+    if kind == "python":
+        return random.Random(seed)
+    if kind == "buffered":
+        return BufferedRandom(seed)
+    if kind == "secure":
+        if seed is not None:
+            raise ValueError("The secure RNG cannot be seeded.")
+        return secrets.SystemRandom()
+    raise ValueError(f"Unsupported RNG kind: {kind}")
+
+
+def session_rng(seed: Any, round_index: int) -> random.Random:
+    """Deterministic stream for one round of a seeded session."""
+    return random.Random(f"{seed}:{round_index}")
+
+
+_default_rng = None
+
+
+def get_rng():
+    """Return the process-wide provider, creating it from the environment once."""
+    global _default_rng
+    if _default_rng is None:
+        _default_rng = create_rng(
+            os.environ.get("LUCK_ARCADE_RNG", "python"),
+            os.environ.get("LUCK_ARCADE_SEED"),
+        )
+    return _default_rng
+
+
+def set_rng(provider) -> None:
+    global _default_rng
+    _default_rng = provider
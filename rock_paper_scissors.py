@@ -1,10 +1,10 @@
-import random as rd
-
 from cli_utils import prompt_nonempty, prompt_yes_no, run_global_command
+from engine import ENGINES, RPS_CHOICES, rps_result
+from rng import get_rng
 from stats import update_and_persist_stats
 
-CHOICES = ("Rock", "Paper", "Scissors")
-_BEATS = {"Rock": "Scissors", "Paper": "Rock", "Scissors": "Paper"}
+CHOICES = RPS_CHOICES
+_RPS = ENGINES["rps"]
 
 
 def normalize_rps_choice(text: str) -> str | None:
@@ -21,9 +21,7 @@ def normalize_rps_choice(text: str) -> str | None:
 
 
 def rps_round_result(user_choice: str, comp_choice: str) -> str:
-    if user_choice == comp_choice:
-        return "tie"
-    return "win" if _BEATS[user_choice] == comp_choice else "loss"
+    return rps_result(user_choice, comp_choice)
 
 
 def game_rock_paper_scissors():
@@ -67,8 +65,8 @@ def game_rock_paper_scissors():
                 print("Pick rock, paper, or scissors.")
                 continue
 
-            comp_choice = rd.choice(CHOICES)
-            result = rps_round_result(user_choice, comp_choice)
+            outcome = _RPS.step(None, user_choice, get_rng())
+            comp_choice, result = outcome.draw, outcome.result
             print()
             print(f"You chose: {user_choice}")
             print(f"Computer chose: {comp_choice}")
@@ -0,0 +1,86 @@
+"""Production launcher for the Flask arcade: `luck-arcade-serve`.
+
+Runs `app:app` under gunicorn with threaded workers, app preloading,
+keep-alive and a graceful timeout. Each worker flushes its queued stats on
+exit. Every option can also come from the environment (`LUCK_ARCADE_BIND`,
+`LUCK_ARCADE_WORKERS`, `LUCK_ARCADE_THREADS`, `LUCK_ARCADE_KEEPALIVE`,
+`LUCK_ARCADE_TIMEOUT`, `LUCK_ARCADE_GRACEFUL_TIMEOUT`, `LUCK_ARCADE_PRELOAD`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from gunicorn.app.base import BaseApplication
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, str(default)))
+
+
+def _worker_exit(server, worker) -> None:
+    from app import STATS
+
+    STATS.flush()
+
+
+def build_options(args: argparse.Namespace) -> dict:
+    """Translate launcher arguments into gunicorn settings."""
+    return {
+        "bind": args.bind,
+        "workers": args.workers,
+        "threads": args.threads,
+        "worker_class": "gthread" if args.threads > 1 else "sync",
+        "keepalive": args.keepalive,
+        "timeout": args.timeout,
+        "graceful_timeout": args.graceful_timeout,
+        "preload_app": args.preload,
+        "worker_exit": _worker_exit,
+        "accesslog": "-" if args.access_log else None,
+    }
+
+
+class ArcadeApplication(BaseApplication):
+    def __init__(self, options: dict) -> None:
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app import app
+
+        return app
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the Luck Arcade web UI with gunicorn.")
+    parser.add_argument(
+        "--bind",
+        default=os.environ.get("LUCK_ARCADE_BIND", f"0.0.0.0:{os.environ.get('PORT', '8000')}"),
+    )
+    parser.add_argument("--workers", type=int, default=_env_int("LUCK_ARCADE_WORKERS", 2))
+    parser.add_argument("--threads", type=int, default=_env_int("LUCK_ARCADE_THREADS", 8))
+    parser.add_argument("--keepalive", type=int, default=_env_int("LUCK_ARCADE_KEEPALIVE", 5))
+    parser.add_argument("--timeout", type=int, default=_env_int("LUCK_ARCADE_TIMEOUT", 30))
+    parser.add_argument("--graceful-timeout", type=int, default=_env_int("LUCK_ARCADE_GRACEFUL_TIMEOUT", 20))
+    parser.add_argument(
+        "--preload",
+        action=argparse.BooleanOptionalAction,
+        default=os.environ.get("LUCK_ARCADE_PRELOAD", "1") != "0",
+    )
+    parser.add_argument("--access-log", action="store_true")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.threads < 1:
+        parser.error("--workers and --threads must be >= 1")
+    if args.workers > 1 and os.environ.get("LUCK_ARCADE_SESSION_STORE", "").strip().lower() == "memory":
+        parser.error("the memory session store is per process; use cookie or sqlite with several workers")
+
+    ArcadeApplication(build_options(args)).run()
+
+
+if __name__ == "__main__":
+    main()
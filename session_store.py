@@ -0,0 +1,188 @@
+"""Server-side Flask sessions: the cookie only carries a random session id.
+
+Pick a backend with `LUCK_ARCADE_SESSION_STORE`:
+- `cookie` (default): Flask's signed cookie session.
+- `memory`: in-process LRU with a TTL (one worker only).
+- `sqlite` or `sqlite:<path>`: a local SQLite file shared by workers on one box.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Flask
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_SQLITE_PATH = "sessions.db"
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid: str = "", new: bool = False) -> None:
+        def on_update(session) -> None:
+            session.modified = True
+            session.accessed = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.accessed = False
+
+
+class MemorySessionStore:
+    """LRU of tagged-JSON session dicts; entries expire `ttl` seconds after their last write.
+
+    Entries are stored serialized so the live request session never shares
+    nested lists or dicts with the stored copy.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = DEFAULT_TTL) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._serializer = TaggedJSONSerializer()
+        self._lock = threading.Lock()
+
+    def get(self, sid: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            expires, data = entry
+            if expires <= time.monotonic():
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+        return self._serializer.loads(data)
+
+    def set(self, sid: str, data: dict) -> None:
+        payload = self._serializer.dumps(data)
+        with self._lock:
+            self._entries[sid] = (time.monotonic() + self.ttl, payload)
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteSessionStore:
+    """Session dicts stored as tagged JSON rows in a local SQLite file."""
+
+    _PURGE_EVERY = 500
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH, ttl: float = DEFAULT_TTL) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._serializer = TaggedJSONSerializer()
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, sid: str) -> dict | None:
+        row = self._connection().execute(
+            "SELECT data FROM sessions WHERE sid = ? AND expires > ?", (sid, time.time())
+        ).fetchone()
+        return None if row is None else self._serializer.loads(row[0])
+
+    def set(self, sid: str, data: dict) -> None:
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO sessions (sid, data, expires) VALUES (?, ?, ?)",
+            (sid, self._serializer.dumps(data), time.time() + self.ttl),
+        )
+        self._writes += 1
+        if self._writes % self._PURGE_EVERY == 0:
+            connection.execute("DELETE FROM sessions WHERE expires <= ?", (time.time(),))
+
+    def delete(self, sid: str) -> None:
+        self._connection().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+
+class ServerSessionInterface(SessionInterface):
+    def __init__(self, store) -> None:
+        self.store = store
+
+    def open_session(self, app: Flask, request) -> ServerSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self.store.get(sid)
+            if data is not None:
+                return ServerSession(data, sid=sid)
+        # Unknown ids are never adopted, so a client cannot pick its own session id.
+        return ServerSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app: Flask, session: ServerSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if session.modified or session.new:
+            self.store.set(session.sid, dict(session))
+        if session.new or self.should_set_cookie(app, session):
+            response.set_cookie(
+                name,
+                session.sid,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+
+
+def create_session_store(spec: str):
+    """Build a store from a `LUCK_ARCADE_SESSION_STORE` value (None for cookies)."""
+    kind, _, option = spec.partition(":")
+    kind = kind.strip().lower()
+    if kind in ("", "cookie"):
+        return None
+    if kind == "memory":
+        return MemorySessionStore()
+    if kind == "sqlite":
+        return SQLiteSessionStore(option or DEFAULT_SQLITE_PATH)
+    raise ValueError(f"Unsupported session store: {spec}")
+
+
+def configure_sessions(app: Flask, spec: str | None = None) -> None:
+    """Install the server-side session interface named by `spec` (or the env var)."""
+    if spec is None:
+        spec = os.environ.get("LUCK_ARCADE_SESSION_STORE", "cookie")
+    store = create_session_store(spec)
+    if store is not None:
+        app.session_interface = ServerSessionInterface(store)
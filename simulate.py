@@ -0,0 +1,212 @@
+"""Monte-Carlo estimates for every arcade game using batched NumPy draws."""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+SIM_GAMES = ("dice", "coin", "rps", "meteor", "planet", "guess")
+GUESS_STRATEGIES = ("bisect", "random")
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Exact win probabilities for a player choosing uniformly (and bisecting in
+# Number Guess), used to sanity-check the sampled rates.
+EXPECTED_WIN_RATES = {
+    "dice": 1 / 6,
+    "coin": 1 / 2,
+    "rps": 1 / 3,
+    "meteor": 2 / 3,
+    "planet": 1 / 8,
+    "guess": 7 / 10,
+}
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    game: str
+    rounds: int
+    wins: int
+    losses: int
+    ties: int
+    elapsed: float
+
+    @property
+    def win_rate(self) -> float:
+        return 0.0 if self.rounds == 0 else self.wins / self.rounds
+
+    @property
+    def rounds_per_second(self) -> float:
+        return 0.0 if self.elapsed <= 0 else self.rounds / self.elapsed
+
+    def confidence_interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Wilson score interval for the win rate."""
+        if self.rounds == 0:
+            return 0.0, 1.0
+        n = self.rounds
+        p = self.win_rate
+        denominator = 1 + z * z / n
+        centre = (p + z * z / (2 * n)) / denominator
+        margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+        return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def _dice(rng: np.random.Generator, size: int, strategy: str) -> tuple[int, int, int]:
+    prediction = rng.integers(1, 7, size=size, dtype=np.int8)
+    roll = rng.integers(1, 7, size=size, dtype=np.int8)
+    wins = int(np.count_nonzero(prediction == roll))
+    return wins, size - wins, 0
+
+
+def _coin(rng: np.random.Generator, size: int, strategy: str) -> tuple[int, int, int]:
+    call = rng.integers(0, 2, size=size, dtype=np.int8)
+    landed = rng.integers(0, 2, size=size, dtype=np.int8)
+    wins = int(np.count_nonzero(call == landed))
+    return wins, size - wins, 0
+
+
+def _rps(rng: np.random.Generator, size: int, strategy: str) -> tuple[int, int, int]:
+    # Rock=0, Paper=1, Scissors=2: (user - computer) % 3 is 0 tie, 1 win, 2 loss.
+    user = rng.integers(0, 3, size=size, dtype=np.int8)
+    computer = rng.integers(0, 3, size=size, dtype=np.int8)
+    diff = np.remainder(user - computer, 3)
+    wins = int(np.count_nonzero(diff == 1))
+    ties = int(np.count_nonzero(diff == 0))
+    return wins, size - wins - ties, ties
+
+
+def _meteor(rng: np.random.Generator, size: int, strategy: str) -> tuple[int, int, int]:
+    lane = rng.integers(0, 3, size=size, dtype=np.int8)
+    incoming = rng.integers(0, 3, size=size, dtype=np.int8)
+    losses = int(np.count_nonzero(lane == incoming))
+    return size - losses, losses, 0
+
+
+def _planet(rng: np.random.Generator, size: int, strategy: str) -> tuple[int, int, int]:
+    guess = rng.integers(1, 9, size=size, dtype=np.int8)
+    target = rng.integers(1, 9, size=size, dtype=np.int8)
+    wins = int(np.count_nonzero(guess == target))
+    return wins, size - wins, 0
+
+
+def _guess(rng: np.random.Generator, size: int, strategy: str) -> tuple[int, int, int]:
+    # Three tries at a 1-10 target, narrowing the range with each higher/lower hint.
+    target = rng.integers(1, 11, size=size, dtype=np.int8)
+    low = np.ones(size, dtype=np.int8)
+    high = np.full(size, 10, dtype=np.int8)
+    found = np.zeros(size, dtype=bool)
+    for _ in range(3):
+        if strategy == "bisect":
+            guess = (low + high) // 2
+        else:
+            guess = rng.integers(low, high + 1, dtype=np.int8)
+        found |= guess == target
+        higher = target > guess
+        lower = ~higher & ~found
+        low = np.where(higher, guess + 1, low)
+        high = np.where(lower, guess - 1, high)
+    wins = int(np.count_nonzero(found))
+    return wins, size - wins, 0
+
+
+_CHUNK_RUNNERS = {
+    "dice": _dice,
+    "coin": _coin,
+    "rps": _rps,
+    "meteor": _meteor,
+    "planet": _planet,
+    "guess": _guess,
+}
+
+
+def simulate(
+    game: str,
+    rounds: int,
+    *,
+    seed: int | np.random.SeedSequence | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    strategy: str = "bisect",
+) -> SimulationResult:
+    """Play `rounds` rounds of one game, drawing outcomes `chunk_size` at a time."""
+    if game not in _CHUNK_RUNNERS:
+        raise ValueError(f"Unsupported game: {game}")
+    if strategy not in GUESS_STRATEGIES:
+        raise ValueError(f"Unsupported strategy: {strategy}")
+    if rounds < 0:
+        raise ValueError("rounds must be >= 0")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+
+    runner = _CHUNK_RUNNERS[game]
+    rng = np.random.default_rng(seed)
+    wins = losses = ties = 0
+    started = time.perf_counter()
+    remaining = rounds
+    while remaining:
+        size = min(chunk_size, remaining)
+        chunk_wins, chunk_losses, chunk_ties = runner(rng, size, strategy)
+        wins += chunk_wins
+        losses += chunk_losses
+        ties += chunk_ties
+        remaining -= size
+    return SimulationResult(game, rounds, wins, losses, ties, time.perf_counter() - started)
+
+
+def simulate_all(
+    rounds: int,
+    *,
+    games: tuple[str, ...] = SIM_GAMES,
+    seed: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    strategy: str = "bisect",
+) -> list[SimulationResult]:
+    """Simulate several games with independent, reproducible streams."""
+    streams = np.random.SeedSequence(seed).spawn(len(games))
+    return [
+        simulate(game, rounds, seed=stream, chunk_size=chunk_size, strategy=strategy)
+        for game, stream in zip(games, streams)
+    ]
+
+
+def format_result(result: SimulationResult, *, strategy: str = "bisect") -> str:
+    low, high = result.confidence_interval()
+    line = (
+        f"{result.game}: {result.win_rate:.4%} win (95% CI {low:.4%}-{high:.4%}) | "
+        f"{result.wins}W/{result.losses}L/{result.ties}T | "
+        f"{result.rounds:,} rounds in {result.elapsed:.2f}s ({result.rounds_per_second:,.0f}/s)"
+    )
+    expected = EXPECTED_WIN_RATES.get(result.game)
+    if expected is not None and (result.game != "guess" or strategy == "bisect"):
+        verdict = "ok" if low <= expected <= high else "OUTSIDE CI"
+        line += f" | expected {expected:.4%} [{verdict}]"
+    return line
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Estimate win rates with Monte-Carlo simulation.")
+    parser.add_argument("games", nargs="*", metavar="GAME", help=f"one of {', '.join(SIM_GAMES)} (default: all)")
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--strategy", choices=GUESS_STRATEGIES, default="bisect")
+    args = parser.parse_args(argv)
+    unknown = [game for game in args.games if game not in SIM_GAMES]
+    if unknown:
+        parser.error(f"unsupported game(s): {', '.join(unknown)}")
+
+    results = simulate_all(
+        args.rounds,
+        games=tuple(args.games or SIM_GAMES),
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        strategy=args.strategy,
+    )
+    for result in results:
+        print(format_result(result, strategy=args.strategy))
+
+
+if __name__ == "__main__":
+    main()
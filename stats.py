@@ -1,7 +1,43 @@
+import atexit
 import json
+import os
+import secrets
+import signal
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows falls back to best-effort appends.
+    fcntl = None
+
 GAMES = ("dice", "coin", "rps", "meteor", "planet", 'guess')
+RESULTS = ("win", "loss")
+_OUTCOMES = frozenset((game, result) for game in GAMES for result in RESULTS)
+
+# Every play is appended to `<storage_path>.journal` as a fixed-size record
+# ("dice win 1" padded to RECORD_SIZE bytes). `stats.json` stays the snapshot;
+# once the journal grows past COMPACT_AFTER_BYTES it is folded back into it.
+RECORD_SIZE = 32
+COMPACT_AFTER_BYTES = RECORD_SIZE * 256
+_FOLDED_KEY = "journal_folded"
+
+# Paths ending in one of these suffixes are stored in SQLite (WAL mode) instead,
+# which lets several worker processes bump the same counters atomically.
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+DEFAULT_STATS_PATH = os.environ.get("LUCK_ARCADE_STATS_PATH", "stats.json")
+_sqlite_local = threading.local()
+_io_observer = None
+# Parsed snapshots keyed by stat signature, and per-journal read offsets, so a
+# reload only parses the bytes appended since the previous one.
+_read_cache_lock = threading.Lock()
+_snapshot_cache: dict[str, tuple[tuple, dict, str | None]] = {}
+_journal_cache: dict[str, tuple[bytes, int, str | None, dict]] = {}
 
 
 def default_stats() -> dict:
@@ -12,41 +48,597 @@ def default_stats() -> dict:
     return data
 
 
-def load_stats(storage_path: str = "stats.json") -> dict:
-    path = Path(storage_path)
+def _journal_paths(storage_path: str) -> tuple[Path, Path]:
+    journal = Path(f"{storage_path}.journal")
+    return journal, journal.with_name(f"{journal.name}.pending")
+
+
+def _encode_record(text: str) -> bytes:
+    record = text.encode("utf-8")
+    if len(record) >= RECORD_SIZE:
+        raise ValueError(f"Journal record too long: {text!r}")
+    return record.ljust(RECORD_SIZE - 1) + b"\n"
+
+
+def _read_snapshot(path: Path) -> tuple[dict, str | None]:
     defaults = default_stats()
     if not path.exists():
-        return defaults
+        return defaults, None
     try:
         payload = json.loads(path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
-        return defaults
+        return defaults, None
     if not isinstance(payload, dict):
-        return defaults
+        return defaults, None
 
     merged = defaults.copy()
     for key in merged:
         value = payload.get(key, merged[key])
         merged[key] = value if isinstance(value, int) and value >= 0 else merged[key]
-    return merged
+    folded = payload.get(_FOLDED_KEY)
+    return merged, folded if isinstance(folded, str) else None
+
+
+def _read_snapshot_cached(path: Path) -> tuple[dict, str | None]:
+    try:
+        info = path.stat()
+    except OSError:
+        return default_stats(), None
+    # Snapshots are only ever replaced, so a new inode/size/mtime means new content.
+    signature = (info.st_ino, info.st_size, info.st_mtime_ns)
+    key = str(path)
+    with _read_cache_lock:
+        cached = _snapshot_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1]), cached[2]
+    stats, folded = _read_snapshot(path)
+    with _read_cache_lock:
+        _snapshot_cache[key] = (signature, dict(stats), folded)
+    return stats, folded
+
+
+def _read_journal(path: Path) -> tuple[str | None, list[tuple[str, str, int]]]:
+    """Return the journal token and records, parsing only bytes new since the last call.
 
+    The first slot holds a random token, so it identifies the file: a different
+    head (a fresh journal, even on a reused inode) starts over from offset 0.
+    """
+    key = str(path)
+    try:
+        with open(path, "rb") as handle:
+            head = handle.read(RECORD_SIZE)
+            with _read_cache_lock:
+                cached = _journal_cache.get(key)
+            if cached is not None and cached[0] == head:
+                _, offset, token, counts = cached
+                counts = dict(counts)
+            else:
+                offset, token, counts = 0, None, {}
+            handle.seek(offset)
+            raw = handle.read()
+    except OSError:
+        with _read_cache_lock:
+            _journal_cache.pop(key, None)
+        return None, []
+
+    new_token, records, consumed = _scan_journal(raw)
+    token = token or new_token
+    for game, result, count in records:
+        counts[(game, result)] = counts.get((game, result), 0) + count
+    if len(head) == RECORD_SIZE:
+        with _read_cache_lock:
+            _journal_cache[key] = (head, offset + consumed, token, counts)
+    return token, [(game, result, count) for (game, result), count in counts.items()]
+
+
+def _parse_journal(raw: bytes) -> tuple[str | None, list[tuple[str, str, int]]]:
+    """Return the journal token and its intact records."""
+    token, records, _ = _scan_journal(raw)
+    return token, records
+
+
+def _scan_journal(raw: bytes) -> tuple[str | None, list[tuple[str, str, int]], int]:
+    """Return the token, the intact records and the offset just past the last intact slot.
+
+    A slot only counts when it is complete and holds exactly one newline, so a
+    torn tail (or the padding written after one) is skipped instead of misread.
+    Trailing bad slots are not consumed, so a read racing an append retries them.
+    """
+    token = None
+    records = []
+    consumed = 0
+    for offset in range(0, len(raw) - RECORD_SIZE + 1, RECORD_SIZE):
+        slot = raw[offset : offset + RECORD_SIZE]
+        if slot.count(b"\n") != 1 or not slot.endswith(b"\n"):
+            continue
+        fields = slot.decode("utf-8", errors="replace").split()
+        if len(fields) == 1 and fields[0].startswith("#"):
+            token = token or fields[0][1:]
+            consumed = offset + RECORD_SIZE
+            continue
+        if len(fields) != 3 or fields[0] not in GAMES or fields[1] not in RESULTS:
+            continue
+        if not fields[2].isdigit():
+            continue
+        records.append((fields[0], fields[1], int(fields[2])))
+        consumed = offset + RECORD_SIZE
+    return token, records, consumed
+
+
+def _apply_records(stats: dict, records: list[tuple[str, str, int]]) -> None:
+    for game, result, count in records:
+        stats["stats_total"] += count
+        stats[f"stats_{game}_{result}"] += count
+
+
+def _write_snapshot(path: Path, data: dict, folded: str | None) -> None:
+    payload = dict(data)
+    if folded is not None:
+        payload[_FOLDED_KEY] = folded
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(payload, indent=2))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
-def save_stats(data: dict, storage_path: str = "stats.json") -> dict:
+
+def _lock_fd(fd: int, *, exclusive: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+@contextmanager
+def _compaction_lock(storage_path: str, *, exclusive: bool = True):
+    """Folds hold `<path>.lock` exclusively; readers share it so no fold lands mid-read."""
+    try:
+        fd = os.open(f"{storage_path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        if exclusive:
+            raise
+        # Read-only directory: nobody can fold here either, so read unlocked.
+        yield
+        return
+    try:
+        _lock_fd(fd, exclusive=exclusive)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _append_records(storage_path: str, records: list[tuple[str, str, int]]) -> int:
+    """Append records in a single write and return the new journal size.
+
+    Writers hold a shared lock on the journal while appending; a fold takes the
+    exclusive lock after renaming it, so an append either lands before the fold
+    reads the file or sees the file unlinked and retries on the fresh journal.
+    """
+    journal, _ = _journal_paths(storage_path)
+    payload = b"".join(_encode_record(f"{game} {result} {count}") for game, result, count in records)
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    while True:
+        fd = os.open(journal, flags, 0o644)
+        try:
+            _lock_fd(fd, exclusive=False)
+            info = os.fstat(fd)
+            if info.st_nlink == 0:
+                continue
+            size = info.st_size
+            if size == 0:
+                payload = _encode_record(f"#{secrets.token_hex(8)}") + payload
+            elif size % RECORD_SIZE:
+                # Re-align after a torn tail; the padded slot is rejected on read.
+                payload = b"\n" * (RECORD_SIZE - size % RECORD_SIZE) + payload
+            os.write(fd, payload)
+            return size + len(payload)
+        finally:
+            os.close(fd)
+
+
+def _fold_journal(storage_path: str, replacement: dict | None = None) -> dict:
+    """Fold journal records into the snapshot, or replace both with `replacement`.
+
+    The live journal is first renamed to `.pending` so new plays keep appending
+    to a fresh file. The snapshot remembers the token of the journal it folded,
+    which makes a crash between the snapshot write and the unlink harmless.
+    """
     path = Path(storage_path)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    journal, pending = _journal_paths(storage_path)
+    stats = None
+    with _compaction_lock(storage_path):
+        # A stale pending file from an interrupted fold goes first, then the live journal.
+        for _ in range(2):
+            if not pending.exists():
+                try:
+                    os.replace(journal, pending)
+                except FileNotFoundError:
+                    break
+            with open(pending, "rb") as handle:
+                _lock_fd(handle.fileno(), exclusive=True)
+                token, records = _parse_journal(handle.read())
+                if replacement is None:
+                    stats, folded = _read_snapshot(path)
+                    if token != folded:
+                        _apply_records(stats, records)
+                else:
+                    stats = replacement
+                _write_snapshot(path, stats, token)
+                pending.unlink(missing_ok=True)
+
+        if stats is None and replacement is not None:
+            stats = replacement
+            _write_snapshot(path, stats, None)
+    if stats is None:
+        return load_stats(storage_path)
+    return stats
+
+
+def _is_sqlite_path(storage_path: str) -> bool:
+    return str(storage_path).lower().endswith(SQLITE_SUFFIXES)
+
+
+def _sqlite_connection(storage_path: str):
+    # One connection per thread and process; a forked worker opens its own.
+    connections = _sqlite_local.__dict__.setdefault("connections", {})
+    key = (os.getpid(), str(storage_path))
+    connection = connections.get(key)
+    if connection is None:
+        import sqlite3
+
+        connection = sqlite3.connect(str(storage_path), timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS stats (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        connection.executemany(
+            "INSERT OR IGNORE INTO stats (key, value) VALUES (?, 0)",
+            [(key_name,) for key_name in default_stats()],
+        )
+        connections[key] = connection
+    return connection
+
+
+def _sqlite_rows_to_stats(rows) -> dict:
+    stats = default_stats()
+    for key, value in rows:
+        if key in stats and isinstance(value, int) and value >= 0:
+            stats[key] = value
+    return stats
+
+
+@contextmanager
+def _sqlite_transaction(storage_path: str):
+    connection = _sqlite_connection(storage_path)
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def _sqlite_increment(storage_path: str, records: list[tuple[str, str, int]]) -> dict:
+    deltas = {"stats_total": 0}
+    for game, result, count in records:
+        deltas["stats_total"] += count
+        key = f"stats_{game}_{result}"
+        deltas[key] = deltas.get(key, 0) + count
+    with _sqlite_transaction(storage_path) as connection:
+        connection.executemany(
+            "UPDATE stats SET value = value + ? WHERE key = ?",
+            [(count, key) for key, count in deltas.items()],
+        )
+        return _sqlite_rows_to_stats(connection.execute("SELECT key, value FROM stats"))
+
+
+def _persist_records(storage_path: str, records: list[tuple[str, str, int]]) -> dict:
+    return _persist_records_signed(storage_path, records)[0]
+
+
+def _persist_records_signed(storage_path: str, records: list[tuple[str, str, int]]) -> tuple[dict, tuple]:
+    """Persist `records`; also return a storage signature taken before the totals were read.
+
+    A write from another worker landing after the signature only makes the
+    next `StatsCache._refresh` reload; a signature taken after the read could
+    hide that write from the cache.
+    """
+    if _is_sqlite_path(storage_path):
+        signature = _storage_signature(storage_path)
+        return _sqlite_increment(storage_path, records), signature
+    size = _append_records(storage_path, records)
+    signature = _storage_signature(storage_path)
+    if size >= COMPACT_AFTER_BYTES:
+        return compact_stats(storage_path), signature
+    return load_stats(storage_path), signature
+
+
+def load_stats(storage_path: str = DEFAULT_STATS_PATH) -> dict:
+    if _is_sqlite_path(storage_path):
+        return _sqlite_rows_to_stats(_sqlite_connection(storage_path).execute("SELECT key, value FROM stats"))
+
+    # The shared lock keeps folds out while the three files are read; without
+    # it, two folds finishing between reads would count a journal twice.
+    with _compaction_lock(storage_path, exclusive=False):
+        journals = [_read_journal(journal) for journal in reversed(_journal_paths(storage_path))]
+        stats, folded = _read_snapshot_cached(Path(storage_path))
+    for token, records in journals:
+        if records and token != folded:
+            _apply_records(stats, records)
+    return stats
+
+
+def save_stats(data: dict, storage_path: str = DEFAULT_STATS_PATH) -> dict:
+    if _is_sqlite_path(storage_path):
+        with _sqlite_transaction(storage_path) as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO stats (key, value) VALUES (?, ?)",
+                [(key, data.get(key, 0)) for key in default_stats()],
+            )
+        return data
+    _fold_journal(storage_path, replacement=data)
     return data
 
 
-def update_and_persist_stats(game: str, result: str, *, storage_path: str = "stats.json") -> dict:
+def compact_stats(storage_path: str = DEFAULT_STATS_PATH) -> dict:
+    """Fold the journal into the snapshot file and return the totals."""
+    if _is_sqlite_path(storage_path):
+        return load_stats(storage_path)
+    return _fold_journal(storage_path)
+
+
+def update_and_persist_stats(game: str, result: str, *, storage_path: str = DEFAULT_STATS_PATH) -> dict:
     if game not in GAMES:
         raise ValueError(f"Unsupported game: {game}")
-    if result not in ("win", "loss"):
+    if result not in RESULTS:
         raise ValueError(f"Unsupported result: {result}")
+    return _persist_records(storage_path, [(game, result, 1)])
+
+
+def _count_outcomes(outcomes: Iterable[tuple[str, str]], counts: Counter | None = None) -> Counter:
+    # Counter does the single pass in C; only the distinct keys need checking.
+    added = Counter(outcomes)
+    for outcome in added:
+        if outcome in _OUTCOMES:
+            continue
+        if not isinstance(outcome, tuple) or len(outcome) != 2 or outcome[0] not in GAMES:
+            raise ValueError(f"Unsupported outcome: {outcome!r}")
+        raise ValueError(f"Unsupported result: {outcome[1]}")
+    if counts is None:
+        return added
+    counts.update(added)
+    return counts
+
+
+def _persist_counts(storage_path: str, counts: Counter) -> dict:
+    if not counts:
+        return load_stats(storage_path)
+    return _persist_records(storage_path, [(game, result, count) for (game, result), count in counts.items()])
+
+
+def record_many(outcomes: Iterable[tuple[str, str]], *, storage_path: str = DEFAULT_STATS_PATH) -> dict:
+    """Record many `(game, result)` tuples with a single write."""
+    return _persist_counts(storage_path, _count_outcomes(outcomes))
+
+
+class StatsBatch:
+    """Collect outcomes in memory and persist them once on exit.
+
+    with StatsBatch() as batch:
+        batch.record("dice", "win")
+    """
+
+    def __init__(self, storage_path: str = DEFAULT_STATS_PATH) -> None:
+        self.storage_path = storage_path
+        self.counts: Counter = Counter()
+
+    def record(self, game: str, result: str) -> None:
+        if game not in GAMES:
+            raise ValueError(f"Unsupported game: {game}")
+        if result not in RESULTS:
+            raise ValueError(f"Unsupported result: {result}")
+        self.counts[(game, result)] += 1
+
+    def record_many(self, outcomes: Iterable[tuple[str, str]]) -> None:
+        _count_outcomes(outcomes, self.counts)
+
+    def commit(self) -> dict:
+        counts, self.counts = self.counts, Counter()
+        return _persist_counts(self.storage_path, counts)
+
+    def __enter__(self) -> "StatsBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+
+
+def set_io_observer(observer) -> None:
+    """Have StatsCache call `observer(op, seconds)` after each "read" and "write"."""
+    global _io_observer
+    _io_observer = observer
+
+
+def _storage_signature(storage_path: str) -> tuple:
+    if _is_sqlite_path(storage_path):
+        paths = (Path(storage_path), Path(f"{storage_path}-wal"))
+    else:
+        paths = (Path(storage_path), *_journal_paths(storage_path))
+    signature = []
+    for path in paths:
+        try:
+            info = path.stat()
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append((info.st_ino, info.st_size, info.st_mtime_ns))
+    return tuple(signature)
+
+
+class StatsCache:
+    """In-memory totals with write-behind persistence.
+
+    Reads are served from memory; the backing files are only re-read when their
+    stat signature changes (checked at most every `refresh_interval` seconds).
+    Recorded results are coalesced and written once `max_pending` rounds are
+    queued or `flush_interval` seconds have passed, whichever comes first.
+    With `flush_inline=False` a full batch is written on a background thread
+    instead of inside the `record` call that filled it.
+    """
+
+    def __init__(
+        self,
+        storage_path: str = DEFAULT_STATS_PATH,
+        *,
+        flush_interval: float = 2.0,
+        max_pending: int = 50,
+        refresh_interval: float = 1.0,
+        flush_inline: bool = True,
+    ) -> None:
+        self.storage_path = storage_path
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.refresh_interval = refresh_interval
+        self.flush_inline = flush_inline
+        self.version = 0
+        self._lock = threading.RLock()
+        self._base: dict | None = None
+        self._view: dict | None = None
+        self._pending: dict[tuple[str, str], int] = {}
+        self._pending_count = 0
+        self._signature: tuple | None = None
+        self._checked_at = 0.0
+        self._timer: threading.Timer | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending_count
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._refresh()
+            return dict(self._current())
+
+    def snapshot(self) -> tuple[int, dict]:
+        """Return `(version, totals)` read under one lock."""
+        with self._lock:
+            self._refresh()
+            return self.version, dict(self._current())
+
+    def record(self, game: str, result: str) -> dict:
+        if game not in GAMES:
+            raise ValueError(f"Unsupported game: {game}")
+        if result not in RESULTS:
+            raise ValueError(f"Unsupported result: {result}")
+        with self._lock:
+            self._refresh()
+            key = (game, result)
+            self._pending[key] = self._pending.get(key, 0) + 1
+            self._pending_count += 1
+            self._changed()
+            if self._pending_count < self.max_pending and self.flush_interval > 0:
+                self._schedule_flush(self.flush_interval)
+            elif self.flush_inline:
+                self.flush()
+            else:
+                self._schedule_flush(0)
+            return dict(self._current())
+
+    def flush(self) -> dict:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                self._refresh()
+                return dict(self._current())
+            before = self._current()
+            records = [(game, result, count) for (game, result), count in self._pending.items()]
+            started = time.perf_counter()
+            totals, signature = _persist_records_signed(self.storage_path, records)
+            if _io_observer is not None:
+                _io_observer("write", time.perf_counter() - started)
+            self._pending.clear()
+            self._pending_count = 0
+            self._signature = signature
+            self._checked_at = time.monotonic()
+            self._base = totals
+            self._view = None
+            if totals != before:
+                self.version += 1
+            return dict(totals)
+
+    def invalidate(self) -> None:
+        """Force the next read to reload totals from storage."""
+        with self._lock:
+            self._signature = None
+            self._checked_at = 0.0
+
+    def install_shutdown_hooks(self) -> None:
+        """Flush queued rounds on interpreter exit and on SIGTERM (main thread only).
+
+        Meant for entry points that own the process; the previous SIGTERM
+        disposition still applies afterwards (an ignored signal stays ignored).
+        """
+        atexit.register(self._flush_pending)
+        if threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def _on_sigterm(signum, frame):
+            self._flush_pending()
+            if callable(previous):
+                previous(signum, frame)
+            elif previous == signal.SIG_DFL:
+                signal.signal(signum, signal.SIG_DFL)
+                os.kill(os.getpid(), signum)
+
+        signal.signal(signal.SIGTERM, _on_sigterm)
+
+    def _flush_pending(self) -> None:
+        if self._pending_count:
+            self.flush()
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if self._base is not None and now - self._checked_at < self.refresh_interval:
+            return
+        self._checked_at = now
+        signature = _storage_signature(self.storage_path)
+        if self._base is not None and signature == self._signature:
+            return
+        self._signature = signature
+        started = time.perf_counter()
+        totals = load_stats(self.storage_path)
+        if _io_observer is not None:
+            _io_observer("read", time.perf_counter() - started)
+        if totals != self._base:
+            self._base = totals
+            self._changed()
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._view = None
+
+    def _current(self) -> dict:
+        if self._view is None:
+            view = dict(self._base)
+            _apply_records(view, [(game, result, count) for (game, result), count in self._pending.items()])
+            self._view = view
+        return self._view
 
-    stats = load_stats(storage_path)
-    stats["stats_total"] += 1
-    stats[f"stats_{game}_{result}"] += 1
-    return save_stats(stats, storage_path)
+    def _schedule_flush(self, delay: float) -> None:
+        if self._timer is not None:
+            if delay > 0 or self._timer.interval == 0:
+                return
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
 
 
 def format_stats_summary(stats: dict) -> str:
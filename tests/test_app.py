@@ -0,0 +1,211 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import app as arcade
+from stats import StatsCache
+
+
+class AppTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.stats_path = str(Path(self.tmpdir.name) / "stats.json")
+        stats_patch = patch.object(arcade, "STATS", StatsCache(self.stats_path, flush_interval=0))
+        stats_patch.start()
+        self.addCleanup(stats_patch.stop)
+        self.client = arcade.app.test_client()
+
+    def play(self, game, **fields):
+        return self.client.post("/action", data={"game": game, **fields})
+
+
+class TestHistory(AppTestCase):
+    def test_history_is_compact_and_rendered_newest_first(self):
+        for prediction in range(1, 7):
+            self.play("Dice Roll", prediction=str(prediction))
+        with self.client.session_transaction() as session:
+            history = session["dice_history"]
+            self.assertEqual([entry[1] for entry in history], [1, 2, 3, 4, 5, 6])
+            self.assertTrue(all(isinstance(entry, tuple) and len(entry) == 3 for entry in history))
+        page = self.client.get("/").get_data(as_text=True)
+        self.assertLess(page.index("Predicted 6, rolled"), page.index("Predicted 5, rolled"))
+        self.assertIn("🎲 Dice Roll: Predicted 6, rolled", page)
+
+    def test_history_ring_keeps_latest_entries(self):
+        for _ in range(arcade.HISTORY_CAPACITY + 5):
+            self.play("Coin Flip", choice="Tails")
+        with self.client.session_transaction() as session:
+            self.assertEqual(len(session["coin_history"]), arcade.HISTORY_CAPACITY)
+            self.assertEqual(len(session["activity_feed"]), arcade.HISTORY_CAPACITY + 5)
+            self.assertEqual(session["ring_heads"]["coin_history"], 5)
+
+    def test_legacy_string_history_is_discarded(self):
+        with self.client.session_transaction() as session:
+            session["dice_history"] = ["Predicted 3, rolled 5"]
+        self.assertEqual(self.client.get("/").status_code, 200)
+        with self.client.session_transaction() as session:
+            self.assertEqual(session["dice_history"], [])
+
+
+class TestGameRegistry(unittest.TestCase):
+    def test_specs_match_engines(self):
+        for key, spec in arcade.GAME_SPECS.items():
+            engine = arcade.ENGINES[key]
+            self.assertEqual(spec.key, key)
+            self.assertIn(spec.parse(spec.default), engine.choices)
+            self.assertIn(spec.codes, ((), engine.choices))
+            self.assertTrue({"win", "loss"} <= set(spec.flashes))
+        self.assertEqual(arcade.GAMES["Meteor Dodge"], "meteor")
+        self.assertEqual(len(arcade.RULEBOOK), len(arcade.GAME_SPECS))
+
+
+class TestGameControls(AppTestCase):
+    def test_controls_and_attempts_come_from_the_registry(self):
+        for key, spec in arcade.GAME_SPECS.items():
+            self.play(spec.label, **{spec.field: str(spec.default)})
+            page = self.client.get("/", query_string={"game": spec.label}).get_data(as_text=True)
+            self.assertIn(spec.tip, page)
+            self.assertIn(f'type="submit">{spec.button}</button>', page)
+            self.assertIn(f'name="{spec.field}"', page)
+            self.assertRegex(page, r'Total attempts</p>\s*<p class="metric-value">1</p>')
+            self.assertEqual('value="reset_round"' in page, key in arcade.PLAYERS)
+
+
+class TestDashboard(AppTestCase):
+    def test_view_is_reused_until_totals_change(self):
+        first = arcade._dashboard()
+        self.assertIs(arcade._dashboard(), first)
+        self.client.post("/api/play/coin", json={"choice": "Heads"})
+        second = arcade._dashboard()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.stats["stats_total"], 1)
+        self.assertIsNot(second.games["coin"], first.games["coin"])
+        self.assertIs(second.games["dice"], first.games["dice"])
+
+    def test_view_matches_totals(self):
+        arcade.STATS.record("dice", "win")
+        arcade.STATS.record("dice", "loss")
+        arcade.STATS.record("planet", "win")
+        view = arcade._dashboard()
+        self.assertEqual(view.total_wins, 2)
+        self.assertEqual(view.luck_index, "67%")
+        self.assertEqual(view.best_game_summary, "Top sector: Planet Guess (100% over 1 rounds)")
+        self.assertIn(("Dice Roll", "1W / 1L", "50% WR"), view.stat_cards)
+        self.assertEqual(len(view.stat_cards), 3 + len(arcade.GAMES))
+
+
+class TestConditionalIndex(AppTestCase):
+    def test_repeat_get_is_not_modified(self):
+        first = self.client.get("/?game=Coin Flip")
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("Starboard Rules", first.get_data(as_text=True))
+        etag = first.headers["ETag"]
+        repeat = self.client.get("/?game=Coin Flip", headers={"If-None-Match": etag})
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.headers["ETag"], etag)
+        other_game = self.client.get("/?game=Dice Roll", headers={"If-None-Match": etag})
+        self.assertEqual(other_game.status_code, 200)
+
+    def test_play_changes_etag_and_flash_page_is_not_tagged(self):
+        etag = self.client.get("/").headers["ETag"]
+        self.play("Dice Roll", prediction="2")
+        flashed = self.client.get("/", headers={"If-None-Match": etag})
+        self.assertEqual(flashed.status_code, 200)
+        self.assertNotIn("ETag", flashed.headers)
+        after = self.client.get("/", headers={"If-None-Match": etag})
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after.headers["ETag"], etag)
+
+    def test_totals_from_other_clients_change_etag(self):
+        etag = self.client.get("/").headers["ETag"]
+        arcade.STATS.record("coin", "win")
+        self.assertEqual(self.client.get("/", headers={"If-None-Match": etag}).status_code, 200)
+
+    def test_guess_controls_follow_tries_left(self):
+        self.client.get("/?game=Number Guess")
+        with self.client.session_transaction() as session:
+            session["guess_target"] = 7
+        self.play("Number Guess", guess="1")
+        self.client.get("/?game=Number Guess")
+        page = self.client.get("/?game=Number Guess").get_data(as_text=True)
+        self.assertIn("Tries left in current round: 2", page)
+
+
+class TestJsonApi(AppTestCase):
+    def test_play_returns_outcome_and_deltas(self):
+        response = self.client.post("/api/play/dice", json={"prediction": 4})
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertIn(payload["result"], ("win", "loss"))
+        self.assertEqual(payload["deltas"], {"stats_total": 1, f"stats_dice_{payload['result']}": 1})
+        self.assertEqual(payload["stats"]["stats_total"], 1)
+        self.assertEqual(payload["attempts"], 1)
+        self.assertIn("title", payload["flash"])
+
+    def test_play_does_not_leave_flash_for_html_page(self):
+        self.client.post("/api/play/coin", data={"choice": "Tails"})
+        with self.client.session_transaction() as session:
+            self.assertNotIn("flash_banner", session)
+
+    def test_guess_round_reports_pending(self):
+        with self.client.session_transaction() as session:
+            session["guess_target"] = 7
+            session["guess_tries_left"] = 3
+        payload = self.client.post("/api/play/guess", json={"guess": 2}).get_json()
+        self.assertEqual(payload["result"], "pending")
+        self.assertEqual(payload["deltas"], {})
+        self.assertEqual(payload["guess_tries_left"], 2)
+
+    def test_play_rejects_bad_input(self):
+        self.assertEqual(self.client.post("/api/play/chess", json={}).status_code, 404)
+        self.assertEqual(self.client.post("/api/play/planet", json={"guess": "x"}).status_code, 400)
+
+    def test_illegal_moves_are_rejected_before_anything_is_recorded(self):
+        self.client.post("/action", data={"ui_action": "quick_command", "command": "seed 42"})
+        with self.client.session_transaction() as session:
+            rng_round = session["rng_round"]
+        for game, body in (
+            ("meteor", {"lane": "Nowhere"}),
+            ("coin", {"choice": "Edge"}),
+            ("dice", {"prediction": 99}),
+            ("rps", {"user_choice": "Lizard"}),
+            ("planet", {"guess": 0}),
+            ("guess", {"guess": 11}),
+            ("dice", [4]),
+        ):
+            self.assertEqual(self.client.post(f"/api/play/{game}", json=body).status_code, 400, (game, body))
+        with self.client.session_transaction() as session:
+            self.assertEqual([session.get(f"{key}_attempts", 0) for key in arcade.GAME_SPECS], [0] * 6)
+            self.assertEqual(session["rng_round"], rng_round)
+        self.assertEqual(self.client.get("/api/stats").get_json()["stats"]["stats_total"], 0)
+
+    def test_stats_endpoint(self):
+        self.client.post("/api/play/meteor", json={"lane": "Left"})
+        payload = self.client.get("/api/stats").get_json()
+        self.assertEqual(payload["stats"]["stats_total"], 1)
+        self.assertEqual(set(payload["games"]), set(arcade.GAME_LABELS))
+
+
+class TestSeededSessions(AppTestCase):
+    def _seeded_history(self):
+        client = arcade.app.test_client()
+        client.post("/action", data={"game": "Dice Roll", "ui_action": "quick_command", "command": "seed 42"})
+        for _ in range(5):
+            client.post("/action", data={"game": "Dice Roll", "prediction": "3"})
+        with client.session_transaction() as session:
+            return list(session["dice_history"])
+
+    def test_seed_command_replays_rounds(self):
+        self.assertEqual(self._seeded_history(), self._seeded_history())
+
+    def test_seed_off_clears_seed(self):
+        self.play("Dice Roll", ui_action="quick_command", command="seed 7")
+        self.play("Dice Roll", ui_action="quick_command", command="seed off")
+        with self.client.session_transaction() as session:
+            self.assertNotIn("rng_seed", session)
+
+
+if __name__ == "__main__":
+    unittest.main()
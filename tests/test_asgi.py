@@ -0,0 +1,98 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import app as arcade
+import asgi
+from stats import StatsCache, load_stats
+
+
+async def _call(application, scope, messages):
+    inbox = list(messages)
+    sent = []
+
+    async def receive():
+        return inbox.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await application(scope, receive, send)
+    return sent
+
+
+def _http_scope(method, path, *, query=b"", headers=()):
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "query_string": query,
+        "headers": list(headers),
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 5000),
+    }
+
+
+class TestWsgiBridge(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.stats_path = str(Path(self.tmpdir.name) / "stats.json")
+        self.cache = StatsCache(self.stats_path, flush_interval=60)
+        stats_patch = patch.object(arcade, "STATS", self.cache)
+        stats_patch.start()
+        self.addCleanup(stats_patch.stop)
+        self.bridge = asgi.WsgiBridge(arcade.app, threads=2, on_shutdown=self.cache.flush)
+
+    def request(self, method, path, body=b"", **kwargs):
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = asyncio.run(_call(self.bridge, _http_scope(method, path, **kwargs), messages))
+        start, payload = sent
+        return start["status"], dict(start["headers"]), payload["body"]
+
+    def test_get_renders_page(self):
+        status, headers, body = self.request("GET", "/", query=b"game=Coin+Flip")
+        self.assertEqual(status, 200)
+        self.assertTrue(headers[b"content-type"].startswith(b"text/html"))
+        self.assertIn("🪙 Coin Flip".encode(), body)
+
+    def test_post_json_play(self):
+        status, _, body = self.request(
+            "POST",
+            "/api/play/meteor",
+            body=b'{"lane": "Left"}',
+            headers=[(b"content-type", b"application/json")],
+        )
+        self.assertEqual(status, 200)
+        self.assertIn(b'"game":"meteor"', body)
+        self.assertEqual(self.cache.pending, 1)
+
+    def test_split_cookie_headers_are_joined_with_semicolons(self):
+        headers = [(b"cookie", b"a=1"), (b"cookie", b"b=2"), (b"accept", b"x"), (b"accept", b"y")]
+        environ = asgi.WsgiBridge._environ(_http_scope("GET", "/", headers=headers), b"")
+        self.assertEqual(environ["HTTP_COOKIE"], "a=1; b=2")
+        self.assertEqual(environ["HTTP_ACCEPT"], "x,y")
+
+    def test_oversized_bodies_are_refused(self):
+        self.bridge.max_body = 8
+        status, _, _ = self.request("POST", "/api/play/dice", headers=[(b"content-length", b"100")])
+        self.assertEqual(status, 413)
+        status, _, _ = self.request("POST", "/api/play/dice", body=b'{"prediction": 3}')
+        self.assertEqual(status, 413)
+        self.assertEqual(self.cache.pending, 0)
+
+    def test_lifespan_shutdown_flushes_stats(self):
+        self.cache.record("dice", "win")
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = asyncio.run(_call(self.bridge, {"type": "lifespan"}, messages))
+        self.assertEqual([m["type"] for m in sent], ["lifespan.startup.complete", "lifespan.shutdown.complete"])
+        self.assertEqual(load_stats(self.stats_path)["stats_dice_win"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from benchmarks import Result, compare, load_results, measure
+from benchmarks.__main__ import main
+from benchmarks.cases import BENCHMARKS
+
+
+def _result(name, best):
+    return Result(name, 1, 3, 10, "op", best, best, best)
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_measure_uses_fresh_state_per_repeat(self):
+        benchmark = next(b for b in BENCHMARKS if b.name == "stats.cache_record")
+        result = measure(benchmark, 20, repeat=2)
+        self.assertEqual((result.ops, result.repeat, result.size), (20, 2, 20))
+        self.assertGreater(result.median, 0)
+
+    def test_buffered_rng_keeps_up_with_python_random(self):
+        cases = {benchmark.name: benchmark for benchmark in BENCHMARKS if benchmark.name.startswith("rng.")}
+        for call in ("randint", "choice", "random"):
+            python = measure(cases[f"rng.{call}.python"], 20_000, repeat=3)
+            buffered = measure(cases[f"rng.{call}.buffered"], 20_000, repeat=3)
+            # Loose bound so timer noise cannot fail it; a real regression is several times slower.
+            self.assertLess(buffered.min, python.min * 1.5, call)
+
+    def test_compare_flags_slowdowns_past_threshold(self):
+        rows = compare(
+            [_result("a", 1.3), _result("b", 1.1), _result("new", 1.0)],
+            [_result("a", 1.0), _result("b", 1.0)],
+            threshold=0.2,
+        )
+        self.assertEqual([(row[0].name, row[3]) for row in rows], [("a", True), ("b", False)])
+
+    def test_cli_writes_json_and_compares(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "run.json")
+            argv = ["stats.cache_record", "--size", "10", "--repeat", "1", "--json", path]
+            with redirect_stdout(StringIO()):
+                self.assertEqual(main(argv), 0)
+                results = load_results(path)
+                self.assertEqual([result.key for result in results], ["stats.cache_record[10]"])
+                self.assertEqual(json.loads(Path(path).read_text())["seed"], 1234)
+                self.assertEqual(main(argv[:-2] + ["--compare", path, "--threshold", "100"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,24 @@
 import unittest
 
 from docx import Document
-from docx.oxml.ns import qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from lxml import etree
 
-from docx_editor import add_table, delete_block, delete_content, delete_table, delete_text
+from docx_editor import (
+    EditPlan,
+    TableIndex,
+    add_table,
+    append_rows,
+    delete_block,
+    delete_content,
+    delete_table,
+    delete_text,
+)
 
 _W_P = qn("w:p")
 _W_TBL = qn("w:tbl")
+_MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
 
 
 def _flow_types(document):
@@ -43,6 +55,36 @@ class TestAddTable(unittest.TestCase):
         self.assertEqual(_flow_types(document), ["paragraph", "table", "paragraph"])
         self.assertEqual(document.tables[0].cell(0, 0).text, "X")
 
+    def test_bulk_and_streamed_fills_match_cell_by_cell_output(self):
+        data = [[" a ", None, 3], ["tab\there", "line\nbreak"], []]
+        reference = Document().add_table(rows=4, cols=3)
+        for row_idx, row_values in enumerate(data):
+            for col_idx, value in enumerate(row_values):
+                reference.cell(row_idx, col_idx).text = "" if value is None else str(value)
+        expected = etree.tostring(reference._tbl)
+
+        bulk = add_table(Document(), rows=4, data=data)
+        streamed = add_table(Document(), rows=4, cols=3, data=iter(data))
+        appended = add_table(Document(), data=data[:1])
+        self.assertEqual(append_rows(appended, iter(data[1:] + [[]])), 3)
+
+        for table in (bulk, streamed, appended):
+            self.assertEqual(etree.tostring(table._tbl), expected)
+
+    def test_iterables_without_cols_are_sized_like_lists(self):
+        document = Document()
+        table = add_table(document, data=(row for row in [["a", "b"], ["c"]]))
+        self.assertEqual((len(table.rows), len(table.columns)), (2, 2))
+        self.assertEqual(table.cell(1, 0).text, "c")
+        with self.assertRaises(ValueError):
+            add_table(document, data=iter([]))
+
+    def test_streamed_rows_must_fit_cols(self):
+        document = Document()
+        with self.assertRaises(ValueError):
+            add_table(document, cols=1, data=iter([["a", "b"]]))
+        self.assertEqual(len(document.tables), 0)
+
 
 class TestDeleteTable(unittest.TestCase):
     def test_delete_table_removes_structure_and_content(self):
@@ -84,6 +126,63 @@ class TestDeleteTextAndFlow(unittest.TestCase):
         self.assertNotIn("remove", document.paragraphs[0].text.lower())
         self.assertNotIn("remove", table.cell(0, 0).text.lower())
 
+    def test_delete_text_reaches_nested_tables_and_merged_cells_once(self):
+        document = Document()
+        table = add_table(document, rows=2, cols=2)
+        merged = table.cell(0, 0).merge(table.cell(0, 1))
+        merged.text = "merged remove"
+        inner = table.cell(1, 0).add_table(rows=1, cols=1)
+        inner.cell(0, 0).text = "nested remove"
+
+        replaced = delete_text(document, "remove")
+
+        self.assertEqual(replaced, 2)
+        self.assertEqual(table.cell(0, 0).text, "merged ")
+        self.assertEqual(inner.cell(0, 0).text, "nested ")
+
+    def test_delete_text_skips_text_boxes_and_content_controls(self):
+        document = Document()
+        paragraph = document.add_paragraph("remove")
+        paragraph._p.append(parse_xml(
+            f'<w:r {nsdecls("w")} xmlns:mc="{_MC}"><mc:AlternateContent>'
+            '<mc:Choice Requires="wps"><w:txbxContent><w:p><w:r><w:t>remove</w:t></w:r></w:p></w:txbxContent></mc:Choice>'
+            '<mc:Fallback><w:txbxContent><w:p><w:r><w:t>remove</w:t></w:r></w:p></w:txbxContent></mc:Fallback>'
+            '</mc:AlternateContent></w:r>'
+        ))
+        document._body._element.append(parse_xml(
+            f'<w:sdt {nsdecls("w")}><w:sdtContent><w:p><w:r><w:t>remove</w:t></w:r></w:p></w:sdtContent></w:sdt>'
+        ))
+        document._body._element.append(document._body._element.sectPr)
+
+        self.assertEqual(EditPlan().delete_text("remove").delete_text("remove", include_tables=False).apply(document), [1, 0])
+        self.assertEqual(delete_text(document, "remove"), 0)
+        self.assertEqual(len(document._body._element.xpath(".//w:t[text()='remove']")), 3)
+
+    def test_delete_text_body_only_and_keeps_spaces(self):
+        document = Document()
+        paragraph = document.add_paragraph()
+        paragraph.add_run("drop")
+        paragraph.add_run("drop me")
+        add_table(document, data=[["drop"]])
+
+        replaced = delete_text(document, "drop", include_tables=False)
+
+        self.assertEqual(replaced, 2)
+        self.assertEqual(paragraph.text, " me")
+        self.assertEqual(paragraph.runs[1]._r[-1].get(qn("xml:space")), "preserve")
+        self.assertEqual(document.tables[0].cell(0, 0).text, "drop")
+
+    def test_delete_text_matches_across_runs_but_not_tabs(self):
+        document = Document()
+        paragraph = document.add_paragraph()
+        for text in ("keep re", "mo", "ve here, ", "remove", "d", " re\tmove"):
+            paragraph.add_run(text)
+
+        replaced = delete_text(document, "remove", whole_word=True)
+
+        self.assertEqual(replaced, 1)
+        self.assertEqual([run.text for run in paragraph.runs], ["keep ", "", " here, ", "remove", "d", " re\tmove"])
+
     def test_delete_block_removes_table_without_breaking_flow(self):
         document = Document()
         document.add_paragraph("first")
@@ -108,5 +207,76 @@ class TestDeleteTextAndFlow(unittest.TestCase):
         self.assertEqual(len(document.tables), 0)
 
 
+class TestEditPlan(unittest.TestCase):
+    def test_apply_resolves_against_original_document_and_counts_per_selector(self):
+        document = Document()
+        document.add_paragraph("Alpha beta alphabet")
+        add_table(document, data=[["drop me", "beta"]])
+        document.add_paragraph("middle BETA")
+        add_table(document, data=[["keep beta"]])
+        document.add_paragraph("last")
+
+        plan = (
+            EditPlan()
+            .delete_text("alpha", whole_word=True)
+            .delete_table(contains_text="DROP")
+            .delete_text("beta", case_sensitive=True, include_tables=False)
+            .delete_block(4)
+            .delete_text("")
+        )
+        counts = plan.apply(document)
+
+        self.assertEqual(counts, [1, 1, 1, 1, 0])
+        self.assertEqual([p.text for p in document.paragraphs], ["  alphabet", "middle BETA"])
+        self.assertEqual(_flow_types(document), ["paragraph", "paragraph", "table"])
+        self.assertEqual(document.tables[0].cell(0, 0).text, "keep beta")
+
+    def test_invalid_selectors_fail_before_any_edit(self):
+        document = Document()
+        document.add_paragraph("remove")
+        with self.assertRaises(ValueError):
+            EditPlan().delete_table()
+        with self.assertRaises(IndexError):
+            EditPlan().delete_text("remove").delete_table(table_index=0).apply(document)
+        self.assertEqual(document.paragraphs[0].text, "remove")
+
+
+class TestTableIndex(unittest.TestCase):
+    def test_index_follows_edits_made_through_the_helpers(self):
+        document = Document()
+        index = TableIndex(document)
+        add_table(document, data=[["alpha"]], index=index)
+        add_table(document, data=[["beta"]], index=index)
+        document.add_paragraph("between")
+        self.assertEqual([index.text(table) for table in index.find("A")], ["alpha", "beta"])
+
+        add_table(document, data=[["gamma"]], position=0, index=index)
+        self.assertEqual(index.text(index.find("a", remove_all=False)[0]), "gamma")
+        self.assertEqual(index.find("Gamma", case_sensitive=True), [])
+
+        delete_text(document, "alpha", index=index)
+        self.assertEqual(delete_table(document, contains_text="alpha", index=index), 0)
+        self.assertEqual(delete_table(document, contains_text="amm", index=index), 1)
+        self.assertEqual(delete_block(document, 0, index=index), "table")
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.text(index.table(0)), "beta")
+        self.assertEqual(EditPlan().delete_table(contains_text="beta").apply(document, index), [1])
+        self.assertEqual((len(index), len(document.tables)), (0, 0))
+
+    def test_empty_needle_matches_like_the_plain_scan(self):
+        document = Document()
+        index = TableIndex(document)
+        self.assertEqual(delete_table(document, contains_text="", index=index), 0)
+
+        for value in ("a", "b", "c"):
+            add_table(document, data=[[value]], index=index)
+        self.assertEqual(delete_table(document, contains_text="", remove_all=True, index=index), 3)
+        self.assertEqual((len(index), index.find("")), (0, []))
+
+    def test_rejects_an_index_for_another_document(self):
+        with self.assertRaises(ValueError):
+            delete_table(Document(), table_index=0, index=TableIndex(Document()))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+
+from engine import ENGINES, LOSS, PENDING, TIE, WIN, Game, GuessState, hint, rps_result, tally
+
+
+class FixedRandom:
+    """Stand-in RNG that always returns the same draw."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def randint(self, a, b):
+        return self.value
+
+    def choice(self, seq):
+        return self.value
+
+    def random(self):
+        return self.value
+
+
+class TestEngines(unittest.TestCase):
+    def test_game_without_step_cannot_be_created(self):
+        class Unfinished(Game):
+            key = "unfinished"
+            __slots__ = ()
+
+        with self.assertRaises(TypeError):
+            Unfinished()
+
+    def test_single_round_games(self):
+        samples = [
+            ("dice", 4, 4, WIN),
+            ("dice", 4, 2, LOSS),
+            ("coin", "Heads", "Heads", WIN),
+            ("coin", "Heads", "Tails", LOSS),
+            ("rps", "Rock", "Scissors", WIN),
+            ("rps", "Rock", "Rock", TIE),
+            ("meteor", "Left", "Left", LOSS),
+            ("meteor", "Left", "Right", WIN),
+            ("planet", 3, 3, WIN),
+            ("planet", 3, 7, LOSS),
+        ]
+        for game, move, draw, expected in samples:
+            with self.subTest(game=game, move=move, draw=draw):
+                outcome = ENGINES[game].step(None, move, FixedRandom(draw))
+                self.assertEqual(outcome.result, expected)
+                self.assertEqual(outcome.draw, draw)
+
+    def test_guess_round_threads_state(self):
+        engine = ENGINES["guess"]
+        state = GuessState(target=7, tries_left=3)
+        outcome = engine.step(state, 5, FixedRandom(2))
+        self.assertEqual(outcome.result, PENDING)
+        self.assertEqual(outcome.state, GuessState(7, 2))
+
+        outcome = engine.step(outcome.state, 7, FixedRandom(2))
+        self.assertEqual(outcome.result, WIN)
+        self.assertEqual(outcome.state, GuessState(2, 3))
+        self.assertEqual(engine.attempts_used(GuessState(7, 2)), 2)
+
+    def test_guess_round_runs_out_of_tries(self):
+        outcome = ENGINES["guess"].step(GuessState(7, 1), 1, FixedRandom(9))
+        self.assertEqual(outcome.result, LOSS)
+        self.assertEqual(outcome.state, GuessState(9, 3))
+
+    def test_dice_attempts_are_geometric(self):
+        dice = ENGINES["dice"]
+        self.assertEqual(dice.sample_attempts(FixedRandom(0.0)), 1)
+        self.assertEqual(dice.sample_attempts(FixedRandom(0.2)), 2)
+        rng = random.Random(4)
+        samples = [dice.sample_attempts(rng) for _ in range(20_000)]
+        self.assertAlmostEqual(sum(samples) / len(samples), 6, delta=0.25)
+
+    def test_dice_transcript_ends_on_prediction(self):
+        rolls = list(ENGINES["dice"].iter_rolls(3, 6, random.Random(2)))
+        self.assertEqual(len(rolls), 6)
+        self.assertEqual(rolls[-1], 3)
+        self.assertNotIn(3, rolls[:-1])
+
+    def test_helpers(self):
+        self.assertEqual(rps_result("Paper", "Rock"), WIN)
+        self.assertEqual(rps_result("Paper", "Scissors"), LOSS)
+        self.assertEqual(hint(3, 8), "higher")
+        self.assertEqual(hint(9, 8), "lower")
+
+    def test_tally_counts_every_step(self):
+        counts = tally("coin", ["Heads"] * 1000, random.Random(1))
+        self.assertEqual(counts[WIN] + counts[LOSS], 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,43 @@
+import re
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
 
+import dice_roll
 from coin_flip import _normalize_choice as normalize_coin_choice
+from rng import BufferedRandom
 from rock_paper_scissors import normalize_rps_choice, rps_round_result
 
 
+class TestContinuousDiceRoll(unittest.TestCase):
+    def play(self, *answers):
+        inputs = iter(answers)
+        with patch("builtins.input", lambda prompt="": next(inputs)), redirect_stdout(StringIO()) as output:
+            with patch("dice_roll.get_rng", return_value=BufferedRandom(seed=7)):
+                with patch("dice_roll.update_and_persist_stats") as persist:
+                    dice_roll.continuous_game_dice_roll()
+        persist.assert_called_once_with("dice", "win")
+        text = output.getvalue()
+        attempts = int(re.search(r"It took (\d+) attempts? to get it right", text).group(1))
+        return text, attempts
+
+    def test_fast_mode_prints_only_a_summary(self):
+        text, attempts = self.play("4")
+        self.assertIn("Rolled until a 4 showed up.", text)
+        self.assertNotIn("You rolled a", text)
+        self.assertGreaterEqual(attempts, 1)
+
+    def test_rolls_toggle_prints_every_roll(self):
+        text, attempts = self.play("rolls", "4")
+        self.assertIn("Roll-by-roll transcript on.", text)
+        rolls = re.findall(r"You rolled a (\d)\.", text)
+        self.assertEqual(len(rolls), attempts)
+        self.assertEqual(rolls[-1], "4")
+        self.assertNotIn("4", rolls[:-1])
+        self.assertNotIn("Rolled until", text)
+
+
 class TestCoinFlip(unittest.TestCase):
     def test_normalize_choice(self):
         samples = {
@@ -0,0 +1,49 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+import app as arcade
+from benchmarks.loadtest import main, parse_mix, run_load
+
+
+class FlakyTransport:
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, path, payload=None):
+        self.calls += 1
+        if self.calls % 3 == 0:
+            raise OSError("stats file busy")
+        if self.calls % 3 == 1:
+            return 200, {"result": "win"}
+        return 503, None
+
+
+class TestLoadTest(unittest.TestCase):
+    def test_parse_mix(self):
+        self.assertEqual(parse_mix("dice=3,coin"), {"dice": 3.0, "coin": 1.0})
+        self.assertEqual(set(parse_mix("")), {"dice", "coin", "rps", "meteor", "planet", "guess"})
+        with self.assertRaises(ValueError):
+            parse_mix("chess=1")
+        with self.assertRaises(ValueError):
+            parse_mix("dice=0")
+
+    def test_report_counts_errors_and_mismatch(self):
+        totals = iter([10, 11])
+        report = run_load(FlakyTransport, lambda: next(totals), players=2, rounds=6, mix={"coin": 1})
+        self.assertEqual(report.errors, {"OSError": 4, "HTTP 503": 4})
+        self.assertEqual(report.recorded, 4)
+        self.assertFalse(report.consistent)
+        self.assertEqual(report.requests, 12)
+
+    def test_in_process_run_is_consistent(self):
+        output = StringIO()
+        with patch.object(arcade, "STATS", arcade.STATS), redirect_stdout(output):
+            code = main(["--players", "4", "--rounds", "10", "--mix", "dice,rps,guess"])
+        self.assertEqual(code, 0, output.getvalue())
+        self.assertIn("consistent", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestMainMenu(unittest.TestCase):
+    def test_menu_import_skips_games_and_heavy_dependencies(self):
+        script = (
+            "import sys, main; "
+            "print(sorted(name for name in ('dice_roll', 'stats', 'engine', 'docx', 'flask', 'numpy') "
+            "if name in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_pick_loads_game_on_demand(self):
+        inputs = iter(["3", "n"])
+        with patch("builtins.input", lambda prompt="": next(inputs)), redirect_stdout(StringIO()) as output:
+            with patch("rock_paper_scissors.game_rock_paper_scissors") as game:
+                main.run_cli([])
+        game.assert_called_once_with()
+        self.assertIn("Rock Paper Scissors: beat the computer", output.getvalue())
+
+    def test_profile_startup(self):
+        with redirect_stdout(StringIO()) as output:
+            self.assertEqual(main.run_cli(["--profile-startup"]), 0)
+        report = output.getvalue()
+        self.assertIn("menu imports:", report)
+        self.assertIn("pick 4 (number_guess)", report)
+
+    def test_unknown_argument(self):
+        with redirect_stdout(StringIO()) as output:
+            self.assertEqual(main.run_cli(["--fast"]), 2)
+        self.assertIn("usage:", output.getvalue())
+
+    def test_script_exit_status_follows_run_cli(self):
+        result = subprocess.run(
+            [sys.executable, "main.py", "--fast"], cwd=ROOT, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("usage:", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from metrics import Counter, Gauge, Histogram, Registry
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestRegistry(unittest.TestCase):
+    def test_renders_prometheus_text(self):
+        registry = Registry()
+        plays = registry.add(Counter("plays_total", "Rounds played.", ("game",)))
+        latency = registry.add(Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)))
+        registry.add(Gauge("pending", "Queued rounds.", lambda: 3))
+        plays.inc("dice")
+        plays.inc("dice")
+        plays.inc('say "hi"')
+        latency.observe(0.05, "/")
+        latency.observe(0.5, "/")
+        latency.observe(5, "/")
+        text = registry.render()
+        self.assertIn("# TYPE plays_total counter", text)
+        self.assertIn('plays_total{game="dice"} 2', text)
+        self.assertIn('plays_total{game="say \\"hi\\""} 1', text)
+        self.assertIn('latency_seconds_bucket{route="/",le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{route="/",le="1"} 2', text)
+        self.assertIn('latency_seconds_bucket{route="/",le="+Inf"} 3', text)
+        self.assertIn('latency_seconds_count{route="/"} 3', text)
+        self.assertIn("pending 3", text)
+        self.assertEqual(latency.count("/"), 3)
+
+
+APP_SCRIPT = """
+import app as arcade
+client = arcade.app.test_client()
+client.get("/")
+client.post("/api/play/coin", json={"choice": "Heads"})
+client.post("/api/play/coin", json={"choice": "Tails"})
+response = client.get("/metrics")
+print(response.status_code)
+print(response.get_data(as_text=True))
+"""
+
+
+class TestAppMetrics(unittest.TestCase):
+    def run_app(self, enabled):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env = dict(
+                os.environ,
+                PYTHONPATH=str(ROOT),
+                LUCK_ARCADE_METRICS="1" if enabled else "0",
+                LUCK_ARCADE_STATS_PATH=str(Path(tmpdir) / "stats.json"),
+                LUCK_ARCADE_STATS_FLUSH_ROUNDS="1",
+            )
+            output = subprocess.run(
+                [sys.executable, "-c", APP_SCRIPT], cwd=tmpdir, env=env, capture_output=True, text=True, check=True
+            ).stdout
+        status, _, body = output.partition("\n")
+        return int(status), body
+
+    def test_metrics_endpoint_when_enabled(self):
+        status, body = self.run_app(True)
+        self.assertEqual(status, 200)
+        self.assertIn('luck_arcade_requests_total{route="/api/play/<game>",method="POST",status="200"} 2', body)
+        self.assertIn('luck_arcade_request_seconds_count{route="/",method="GET"} 1', body)
+        self.assertIn('luck_arcade_template_render_seconds_count{template="index.html"} 1', body)
+        self.assertIn('luck_arcade_stats_io_seconds_count{op="write"} 2', body)
+        self.assertIn('luck_arcade_rng_seconds_count{call="choice"} 2', body)
+        self.assertIn("luck_arcade_session_cookie_bytes_count", body)
+        plays = sum(
+            int(line.rsplit(" ", 1)[1]) for line in body.splitlines() if line.startswith("luck_arcade_plays_total{")
+        )
+        self.assertEqual(plays, 2)
+
+    def test_disabled_by_default(self):
+        status, _ = self.run_app(False)
+        self.assertEqual(status, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import secrets
+import unittest
+from collections import Counter
+
+from rng import BufferedRandom, create_rng, get_rng, session_rng, set_rng
+
+
+class TestBufferedRandom(unittest.TestCase):
+    def test_seeded_streams_repeat(self):
+        first = BufferedRandom(seed=9, block_size=16)
+        second = BufferedRandom(seed=9, block_size=16)
+        self.assertEqual(
+            [first.randint(1, 6) for _ in range(100)],
+            [second.randint(1, 6) for _ in range(100)],
+        )
+
+    def test_draws_stay_in_range_across_refills(self):
+        provider = BufferedRandom(seed=1, block_size=8)
+        rolls = Counter(provider.randint(1, 6) for _ in range(6_000))
+        self.assertEqual(set(rolls), {1, 2, 3, 4, 5, 6})
+        self.assertTrue(all(800 < count < 1200 for count in rolls.values()))
+        self.assertIn(provider.choice(("Heads", "Tails")), ("Heads", "Tails"))
+        value = provider.random()
+        self.assertTrue(0.0 <= value < 1.0)
+
+    def test_rejects_empty_inputs(self):
+        provider = BufferedRandom(seed=1)
+        with self.assertRaises(ValueError):
+            provider.randint(3, 1)
+        with self.assertRaises(IndexError):
+            provider.choice(())
+
+
+class TestProviders(unittest.TestCase):
+    def test_create_rng_kinds(self):
+        self.assertEqual(create_rng("python", 5).randint(1, 100), create_rng("python", 5).randint(1, 100))
+        self.assertIsInstance(create_rng("buffered", 5), BufferedRandom)
+        self.assertIsInstance(create_rng("secure"), secrets.SystemRandom)
+        with self.assertRaises(ValueError):
+            create_rng("secure", 5)
+        with self.assertRaises(ValueError):
+            create_rng("dice")
+
+    def test_session_rng_is_deterministic_per_round(self):
+        self.assertEqual(session_rng("abc", 3).random(), session_rng("abc", 3).random())
+        self.assertNotEqual(session_rng("abc", 3).random(), session_rng("abc", 4).random())
+
+    def test_set_rng_swaps_default(self):
+        previous = get_rng()
+        provider = BufferedRandom(seed=2)
+        try:
+            set_rng(provider)
+            self.assertIs(get_rng(), provider)
+        finally:
+            set_rng(previous)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import importlib.util
+import os
+import unittest
+from unittest.mock import patch
+
+HAS_GUNICORN = importlib.util.find_spec("gunicorn") is not None
+
+if HAS_GUNICORN:
+    import serve
+
+
+@unittest.skipUnless(HAS_GUNICORN, "gunicorn is not installed")
+class TestServe(unittest.TestCase):
+    def run_main(self, argv, env=None):
+        with patch.dict(os.environ, env or {}), patch.object(serve, "ArcadeApplication") as application:
+            serve.main(argv)
+        return application.call_args.args[0]
+
+    def test_defaults_use_threaded_preloaded_workers(self):
+        options = self.run_main(["--bind", "127.0.0.1:9000"])
+        self.assertEqual(options["bind"], "127.0.0.1:9000")
+        self.assertEqual(options["worker_class"], "gthread")
+        self.assertTrue(options["preload_app"])
+        self.assertIs(options["worker_exit"], serve._worker_exit)
+
+    def test_environment_and_flags(self):
+        options = self.run_main(
+            ["--threads", "1", "--no-preload"],
+            {"LUCK_ARCADE_WORKERS": "3", "LUCK_ARCADE_KEEPALIVE": "10"},
+        )
+        self.assertEqual(options["workers"], 3)
+        self.assertEqual(options["keepalive"], 10)
+        self.assertEqual(options["worker_class"], "sync")
+        self.assertFalse(options["preload_app"])
+
+    def test_options_are_valid_gunicorn_settings(self):
+        options = self.run_main([])
+        application = serve.ArcadeApplication(options)
+        self.assertEqual(application.cfg.worker_class_str, "gthread")
+        self.assertEqual(application.cfg.threads, 8)
+
+    def test_memory_sessions_need_one_worker(self):
+        with self.assertRaises(SystemExit), patch("sys.stderr"):
+            self.run_main(["--workers", "2"], {"LUCK_ARCADE_SESSION_STORE": "memory"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import app as arcade
+from session_store import (
+    MemorySessionStore,
+    ServerSessionInterface,
+    SQLiteSessionStore,
+    create_session_store,
+)
+from stats import StatsCache
+
+
+class TestMemorySessionStore(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        store = MemorySessionStore(max_entries=2)
+        store.set("a", {"n": 1})
+        store.set("b", {"n": 2})
+        store.get("a")
+        store.set("c", {"n": 3})
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.get("a"), {"n": 1})
+        self.assertEqual(len(store), 2)
+
+    def test_expires_entries(self):
+        store = MemorySessionStore(ttl=0.01)
+        store.set("a", {"n": 1})
+        time.sleep(0.02)
+        self.assertIsNone(store.get("a"))
+
+    def test_nested_values_are_not_shared_with_callers(self):
+        store = MemorySessionStore()
+        session = {"history": [(1, 2)], "ring_heads": {"dice": 0}}
+        store.set("a", session)
+        session["history"].append((3, 4))
+        store.get("a")["ring_heads"]["dice"] = 5
+        self.assertEqual(store.get("a"), {"history": [(1, 2)], "ring_heads": {"dice": 0}})
+
+
+class TestSQLiteSessionStore(unittest.TestCase):
+    def test_round_trip_keeps_tuples(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SQLiteSessionStore(str(Path(tmpdir) / "sessions.db"))
+            store.set("a", {"history": [(1, 2, 3)], "flash": {"kind": "win"}})
+            self.assertEqual(store.get("a"), {"history": [(1, 2, 3)], "flash": {"kind": "win"}})
+            store.delete("a")
+            self.assertIsNone(store.get("a"))
+
+    def test_create_session_store(self):
+        self.assertIsNone(create_session_store("cookie"))
+        self.assertIsInstance(create_session_store("memory"), MemorySessionStore)
+        self.assertEqual(create_session_store("sqlite:/tmp/x.db").path, "/tmp/x.db")
+        with self.assertRaises(ValueError):
+            create_session_store("redis")
+
+
+class TestServerSessions(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        patcher = patch.object(arcade, "STATS", StatsCache(str(Path(tmpdir.name) / "stats.json"), flush_interval=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = MemorySessionStore()
+        patcher = patch.object(arcade.app, "session_interface", ServerSessionInterface(self.store))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = arcade.app.test_client()
+
+    def test_cookie_stays_small_as_history_grows(self):
+        sizes = []
+        for _ in range(40):
+            response = self.client.post("/action", data={"game": "Coin Flip", "choice": "Heads"})
+            sizes.append(len(response.headers.get("Set-Cookie", "")))
+        self.assertLess(max(sizes), 200)
+        self.assertEqual(len(self.store), 1)
+        with self.client.session_transaction() as session:
+            self.assertEqual(session["coin_attempts"], 40)
+
+    def test_unknown_session_id_is_not_adopted(self):
+        self.client.set_cookie("session", "attacker-chosen")
+        self.client.get("/")
+        self.assertIsNone(self.store.get("attacker-chosen"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import importlib.util
+import unittest
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    from simulate import EXPECTED_WIN_RATES, SIM_GAMES, simulate, simulate_all
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestSimulate(unittest.TestCase):
+    def test_counts_add_up(self):
+        for game in SIM_GAMES:
+            with self.subTest(game=game):
+                result = simulate(game, 10_000, seed=7, chunk_size=3_000)
+                self.assertEqual(result.wins + result.losses + result.ties, 10_000)
+
+    def test_rates_match_rules(self):
+        for result in simulate_all(200_000, seed=11):
+            with self.subTest(game=result.game):
+                low, high = result.confidence_interval(z=4)
+                self.assertLessEqual(low, EXPECTED_WIN_RATES[result.game])
+                self.assertGreaterEqual(high, EXPECTED_WIN_RATES[result.game])
+
+    def test_only_rps_has_ties(self):
+        self.assertGreater(simulate("rps", 1_000, seed=3).ties, 0)
+        self.assertEqual(simulate("dice", 1_000, seed=3).ties, 0)
+
+    def test_seed_is_reproducible(self):
+        first = simulate("guess", 50_000, seed=5, strategy="random")
+        second = simulate("guess", 50_000, seed=5, strategy="random")
+        self.assertEqual(first.wins, second.wins)
+
+    def test_rejects_unknown_game(self):
+        with self.assertRaises(ValueError):
+            simulate("chess", 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
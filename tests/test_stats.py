@@ -1,8 +1,24 @@
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from stats import default_stats, format_stats_summary, load_stats, update_and_persist_stats
+import stats
+from stats import (
+    StatsBatch,
+    StatsCache,
+    compact_stats,
+    default_stats,
+    format_stats_summary,
+    load_stats,
+    record_many,
+    save_stats,
+    update_and_persist_stats,
+)
 
 
 class TestStats(unittest.TestCase):
@@ -21,6 +37,126 @@ class TestStats(unittest.TestCase):
             self.assertEqual(data["stats_coin_win"], 1)
             self.assertEqual(data["stats_coin_loss"], 1)
 
+    def test_update_appends_to_journal_without_rewriting_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            save_stats(default_stats(), str(path))
+            before = path.read_text(encoding="utf-8")
+            update_and_persist_stats("dice", "win", storage_path=str(path))
+            self.assertEqual(path.read_text(encoding="utf-8"), before)
+            self.assertEqual(load_stats(str(path))["stats_dice_win"], 1)
+
+    def test_compact_stats_folds_journal_into_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            for _ in range(3):
+                update_and_persist_stats("meteor", "loss", storage_path=str(path))
+            data = compact_stats(str(path))
+            self.assertEqual(data["stats_meteor_loss"], 3)
+            self.assertFalse(Path(f"{path}.journal").exists())
+            self.assertEqual(load_stats(str(path))["stats_total"], 3)
+
+    def test_journal_compacts_automatically(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            rounds = stats.COMPACT_AFTER_BYTES // stats.RECORD_SIZE + 5
+            for _ in range(rounds):
+                update_and_persist_stats("coin", "win", storage_path=str(path))
+            self.assertLess(Path(f"{path}.journal").stat().st_size, stats.COMPACT_AFTER_BYTES)
+            self.assertEqual(load_stats(str(path))["stats_coin_win"], rounds)
+
+    def test_torn_journal_tail_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            update_and_persist_stats("dice", "win", storage_path=str(path))
+            with open(f"{path}.journal", "ab") as handle:
+                handle.write(b"dice win 1")
+            update_and_persist_stats("dice", "loss", storage_path=str(path))
+            data = load_stats(str(path))
+            self.assertEqual(data["stats_dice_win"], 1)
+            self.assertEqual(data["stats_dice_loss"], 1)
+            self.assertEqual(data["stats_total"], 2)
+
+    def test_incremental_reads_retry_a_half_written_tail(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            update_and_persist_stats("coin", "win", storage_path=str(path))
+            record = stats._encode_record("coin loss 1")
+            with open(f"{path}.journal", "ab") as handle:
+                handle.write(record[:10])
+                handle.flush()
+                self.assertEqual(load_stats(str(path))["stats_total"], 1)
+                handle.write(record[10:])
+            self.assertEqual(load_stats(str(path))["stats_coin_loss"], 1)
+            compact_stats(str(path))
+            update_and_persist_stats("coin", "win", storage_path=str(path))
+            self.assertEqual(load_stats(str(path))["stats_total"], 3)
+
+    def test_interrupted_compaction_does_not_double_count(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            update_and_persist_stats("planet", "win", storage_path=str(path))
+            journal = Path(f"{path}.journal")
+            kept = journal.read_bytes()
+            compact_stats(str(path))
+            # Simulate a crash after the snapshot write but before the unlink.
+            Path(f"{journal}.pending").write_bytes(kept)
+            self.assertEqual(load_stats(str(path))["stats_planet_win"], 1)
+            self.assertEqual(compact_stats(str(path))["stats_planet_win"], 1)
+
+    def test_save_stats_replaces_journaled_totals(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            update_and_persist_stats("rps", "win", storage_path=str(path))
+            save_stats(default_stats(), str(path))
+            self.assertEqual(load_stats(str(path)), default_stats())
+
+    def test_sqlite_backend_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.db")
+            self.assertEqual(load_stats(path), default_stats())
+            update_and_persist_stats("guess", "win", storage_path=path)
+            data = update_and_persist_stats("guess", "loss", storage_path=path)
+            self.assertEqual(data["stats_total"], 2)
+            self.assertEqual(load_stats(path)["stats_guess_loss"], 1)
+            save_stats(default_stats(), path)
+            self.assertEqual(load_stats(path), default_stats())
+
+    def test_concurrent_writers_do_not_drop_rounds(self):
+        for name in ("stats.json", "stats.db"):
+            with self.subTest(backend=name), tempfile.TemporaryDirectory() as tmpdir:
+                path = str(Path(tmpdir) / name)
+
+                def play(game):
+                    for index in range(150):
+                        update_and_persist_stats(game, "win" if index % 3 else "loss", storage_path=path)
+
+                workers = [threading.Thread(target=play, args=(game,)) for game in stats.GAMES[:4]]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+
+                data = load_stats(path)
+                self.assertEqual(data["stats_total"], 600)
+                self.assertEqual(
+                    data["stats_total"],
+                    sum(data[f"stats_{game}_{result}"] for game in stats.GAMES for result in stats.RESULTS),
+                )
+
+    def test_reads_wait_for_a_running_fold(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.json")
+            update_and_persist_stats("dice", "win", storage_path=path)
+            results = []
+            with stats._compaction_lock(path):
+                reader = threading.Thread(target=lambda: results.append(load_stats(path)))
+                reader.start()
+                reader.join(0.2)
+                self.assertTrue(reader.is_alive())
+            reader.join()
+            self.assertEqual(results[0]["stats_total"], 1)
+
     def test_format_stats_summary(self):
         data = default_stats()
         data["stats_total"] = 3
@@ -28,3 +164,120 @@ class TestStats(unittest.TestCase):
         summary = format_stats_summary(data)
         self.assertIn("Total plays: 3", summary)
         self.assertIn("dice: 2W/0L", summary)
+
+    def test_record_many_persists_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            outcomes = [("dice", "win")] * 1000 + [("coin", "loss")] * 500
+            data = record_many(outcomes, storage_path=str(path))
+            self.assertEqual(data["stats_total"], 1500)
+            self.assertEqual(data["stats_dice_win"], 1000)
+            journal = Path(f"{path}.journal")
+            self.assertEqual(journal.stat().st_size, stats.RECORD_SIZE * 3)
+
+    def test_record_many_validates_before_writing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            with self.assertRaises(ValueError):
+                record_many([("dice", "win"), ("dice", "draw")], storage_path=str(path))
+            self.assertEqual(load_stats(str(path)), default_stats())
+
+    def test_stats_batch_commits_on_exit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.db")
+            with StatsBatch(path) as batch:
+                batch.record("planet", "loss")
+                batch.record_many([("planet", "win"), ("planet", "win")])
+                self.assertEqual(load_stats(path)["stats_total"], 0)
+            data = load_stats(path)
+            self.assertEqual(data["stats_planet_win"], 2)
+            self.assertEqual(data["stats_total"], 3)
+
+
+class TestStatsCache(unittest.TestCase):
+    def test_record_is_served_from_memory_until_flush(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.json")
+            cache = StatsCache(path, flush_interval=60, max_pending=10)
+            cache.record("dice", "win")
+            cache.record("dice", "loss")
+            self.assertEqual(cache.stats()["stats_total"], 2)
+            self.assertEqual(load_stats(path)["stats_total"], 0)
+            self.assertEqual(cache.flush()["stats_dice_win"], 1)
+            self.assertEqual(load_stats(path)["stats_total"], 2)
+            self.assertEqual(cache.pending, 0)
+
+    def test_flushes_after_max_pending(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.json")
+            cache = StatsCache(path, flush_interval=60, max_pending=3)
+            for _ in range(3):
+                cache.record("coin", "win")
+            self.assertEqual(load_stats(path)["stats_coin_win"], 3)
+
+    def test_background_flush_after_max_pending(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.json")
+            cache = StatsCache(path, flush_interval=60, max_pending=3, flush_inline=False)
+            for _ in range(3):
+                cache.record("coin", "win")
+            self.assertEqual(cache.stats()["stats_coin_win"], 3)
+            deadline = time.monotonic() + 5
+            while cache.pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(load_stats(path)["stats_coin_win"], 3)
+
+    def test_picks_up_external_edits(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.json")
+            cache = StatsCache(path, flush_interval=60, refresh_interval=0)
+            self.assertEqual(cache.stats()["stats_total"], 0)
+            version = cache.version
+            update_and_persist_stats("rps", "loss", storage_path=path)
+            self.assertEqual(cache.stats()["stats_rps_loss"], 1)
+            self.assertGreater(cache.version, version)
+
+    def test_flush_sees_a_write_that_lands_while_it_reads_totals(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.json")
+            cache = StatsCache(path, flush_interval=60, refresh_interval=0)
+            real_load = stats.load_stats
+
+            def load_then_other_worker_appends(storage_path):
+                totals = real_load(storage_path)
+                stats._append_records(storage_path, [("coin", "win", 1)])
+                return totals
+
+            cache.record("dice", "win")
+            with patch.object(stats, "load_stats", load_then_other_worker_appends):
+                self.assertEqual(cache.flush()["stats_total"], 1)
+            self.assertEqual(cache.stats()["stats_total"], 2)
+
+    @unittest.skipUnless(hasattr(stats.signal, "SIGKILL"), "POSIX signals only")
+    def test_sigterm_hook_flushes_and_keeps_an_ignored_signal_ignored(self):
+        script = (
+            "import os, signal, sys\n"
+            "from stats import StatsCache\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "cache = StatsCache(sys.argv[1], flush_interval=60)\n"
+            "cache.install_shutdown_hooks()\n"
+            "cache.record('dice', 'win')\n"
+            "os.kill(os.getpid(), signal.SIGTERM)\n"
+            "print(cache.pending)\n"
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "stats.json")
+            output = subprocess.run(
+                [sys.executable, "-c", script, path],
+                cwd=Path(__file__).resolve().parents[1],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self.assertEqual(output.stdout.strip(), "0")
+            self.assertEqual(load_stats(path)["stats_dice_win"], 1)
+
+    def test_rejects_unknown_game(self):
+        cache = StatsCache("unused.json")
+        with self.assertRaises(ValueError):
+            cache.record("chess", "win")